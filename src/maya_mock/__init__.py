@@ -8,6 +8,7 @@ from maya_mock.base.node import MockedNode
 from maya_mock.base.port import MockedPort
 from maya_mock.base.schema import MockedSessionSchema
 from maya_mock.base.session import MockedSession
+from maya_mock.base.session_sqlite import MockedSqliteSession
 from maya_mock.cmds import MockedCmdsSession
 from maya_mock.pymel import MockedPymelSession, MockedPymelNode, MockedPymelPort
 
@@ -16,6 +17,7 @@ __all__ = (
     "MockedPort",
     "MockedConnection",
     "MockedSession",
+    "MockedSqliteSession",
     "MockedSessionSchema",
     "MockedCmdsSession",
     "MockedPymelSession",
@@ -5,4 +5,5 @@ from maya_mock.base.node import MockedNode
 from maya_mock.base.port import MockedPort
 from maya_mock.base.connection import MockedConnection
 from maya_mock.base.session import MockedSession
+from maya_mock.base.session_sqlite import MockedSqliteSession
 from maya_mock.base.schema import MockedSessionSchema
@@ -6,16 +6,22 @@ Abstract classes
 class BaseDagObject(object):
     """
     Base class for an object that can be represented with a dag path.
+
+    Note: Objects are hashed and compared by identity since their dagpath can change.
+    This ensure an object stored in a set or a dict can still be found after being
+    renamed or re-parented.
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        return self is other
 
     def __ne__(self, other):
-        return hash(self) != hash(other)
+        return self is not other
 
     def __gt__(self, other):
-        return self.dagpath > other.dagapth
+        return self.dagpath > other.dagpath
 
     def __lt__(self, other):
         return self.dagpath < other.dagpath
@@ -26,8 +32,7 @@ class BaseDagObject(object):
     def __le__(self, other):
         return self.dagpath <= other.dagpath
 
-    def __hash__(self):
-        return hash(self.dagpath)
+    __hash__ = object.__hash__
 
     @property
     def dagpath(self):
@@ -0,0 +1,167 @@
+"""
+Columnar storage of the nodes attributes.
+
+Nodes are given integer ids and their type is stored in an array.
+Filtered scans are done by comparing a whole column against a value
+without having to touch the nodes objects.
+The hierarchy is not stored since `DagIndex` already resolve children queries.
+
+Types are stored as one byte per node so a column can be scanned with `bytearray.translate`.
+"""
+import itertools
+
+# Number of distinct values a type byte can hold. The value 0 is reserved for unused slots.
+_TYPE_BUCKETS = 255
+
+
+class NodeColumns(object):
+    """
+    Store the nodes type in a column indexed by node id.
+
+    Ids of removed nodes are reused by the next added nodes.
+    """
+
+    def __init__(self):
+        # Node by id. Unused slots contain None.
+        self._nodes = []
+
+        # Id by node.
+        self._ids = {}
+
+        # Unused ids.
+        self._free = []
+
+        # Node type bucket by node id, see `_get_type_bucket`.
+        self.types = bytearray()
+
+        # Node type code by name and name by code.
+        self._type_codes = {}
+        self._type_names = []
+
+        # Translation tables that map a type bucket to 1 and everything else to 0.
+        self._type_masks = {}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, node):
+        return node in self._ids
+
+    def _get_type_code(self, node_type):
+        """
+        :param str node_type: A node type
+        :return: The integer code of the node type.
+        :rtype: int
+        """
+        try:
+            return self._type_codes[node_type]
+        except KeyError:
+            code = self._type_codes[node_type] = len(self._type_names)
+            self._type_names.append(node_type)
+            return code
+
+    @staticmethod
+    def _get_type_bucket(code):
+        """
+        Types codes are stored in a single byte.
+        If more than 255 types are used, multiple types share the same bucket.
+
+        :param int code: A node type code
+        :return: The bucket of the node type, between 1 and 255.
+        :rtype: int
+        """
+        return code % _TYPE_BUCKETS + 1
+
+    def get_id(self, node):
+        """
+        :param MockedNode node: A registered node
+        :return: The id of the node
+        :rtype: int
+        """
+        return self._ids[node]
+
+    def get_node(self, id_):
+        """
+        :param int id_: A node id
+        :return: The node associated with the id. None if the id is not used.
+        :rtype: MockedNode or None
+        """
+        return self._nodes[id_]
+
+    def get_type(self, id_):
+        """
+        :param int id_: A node id
+        :return: The type of the node.
+        :rtype: str
+        """
+        return self._nodes[id_].type
+
+    def add(self, node):
+        """
+        Register a node.
+
+        :param MockedNode node: The node to register.
+        :return: The id of the node
+        :rtype: int
+        """
+        bucket = self._get_type_bucket(self._get_type_code(node.type))
+
+        if self._free:
+            id_ = self._free.pop()
+            self._nodes[id_] = node
+            self.types[id_] = bucket
+        else:
+            id_ = len(self._nodes)
+            self._nodes.append(node)
+            self.types.append(bucket)
+
+        self._ids[node] = id_
+        return id_
+
+    def remove(self, node):
+        """
+        Unregister a node.
+
+        :param MockedNode node: The node to unregister.
+        """
+        id_ = self._ids.pop(node)
+        self._nodes[id_] = None
+        self.types[id_] = 0
+        self._free.append(id_)
+
+    def iter_nodes(self, node_type=None):
+        """
+        Yield the registered nodes.
+
+        :param node_type: If provided, only yield nodes of this type.
+        :type node_type: str or None
+        :return: A node generator
+        :rtype: Generator[MockedNode]
+        """
+        if node_type is None:
+            return (node for node in self._nodes if node is not None)
+
+        code = self._type_codes.get(node_type)
+        if code is None:
+            return iter(())
+        nodes = itertools.compress(self._nodes, self._select_type(code))
+
+        # Types sharing a bucket need to be told apart.
+        if len(self._type_names) > _TYPE_BUCKETS:
+            nodes = (node for node in nodes if node.type == node_type)
+        return nodes
+
+    def _select_type(self, code):
+        """
+        :param int code: A node type code
+        :return: A byte for each node, 1 if the node type share the bucket of the code, 0 otherwise.
+        :rtype: bytearray
+        """
+        bucket = self._get_type_bucket(code)
+        try:
+            mask = self._type_masks[bucket]
+        except KeyError:
+            mask = bytearray(256)
+            mask[bucket] = 1
+            mask = self._type_masks[bucket] = bytes(mask)
+        return self.types.translate(mask)
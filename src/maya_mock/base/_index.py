@@ -0,0 +1,608 @@
+"""
+Indexes used by the session to resolve nodes from names and dagpaths
+without having to scan every node in the scene.
+"""
+import collections
+import string
+
+from maya_mock.base.matcher import get_dagpath_matcher, get_name_matcher
+
+
+class DagIndex(object):
+    """
+    Hierarchical index of nodes.
+
+    Nodes are indexed both by their leaf name and by their parent and name.
+    The parent index mirror `MockedNode.children` and allow us to resolve
+    a dagpath by walking down the hierarchy one segment at a time.
+    """
+
+    def __init__(self):
+        # Index of nodes by their leaf name.
+        # Multiple nodes can share the same name if they don't share the same parent.
+        self._nodes_by_name = collections.defaultdict(set)
+
+        # Index of nodes by their parent and their name.
+        # Root nodes are indexed with None as their parent.
+        self._children_by_name = collections.defaultdict(
+            lambda: collections.defaultdict(set)
+        )
+
+    def add(self, node):
+        """
+        Register a node in the index.
+
+        :param MockedNode node: The node to register.
+        """
+        self._nodes_by_name[node.name].add(node)
+        self._children_by_name[node.parent][node.name].add(node)
+
+    def remove(self, node):
+        """
+        Unregister a node from the index.
+
+        :param MockedNode node: The node to unregister.
+        """
+        self._discard(node, node.name, node.parent)
+
+    def rename(self, node, old_name):
+        """
+        Update the index after a node was renamed.
+
+        :param MockedNode node: The renamed node.
+        :param str old_name: The previous name of the node.
+        """
+        self._discard(node, old_name, node.parent)
+        self.add(node)
+
+    def reparent(self, node, old_parent):
+        """
+        Update the index after a node changed parent.
+
+        :param MockedNode node: The re-parented node.
+        :param old_parent: The previous parent of the node.
+        :type old_parent: MockedNode or None
+        """
+        self._discard(node, node.name, old_parent)
+        self.add(node)
+
+    def _discard(self, node, name, parent):
+        nodes = self._nodes_by_name.get(name)
+        if nodes is not None:
+            nodes.discard(node)
+            if not nodes:
+                del self._nodes_by_name[name]
+
+        children = self._children_by_name.get(parent)
+        if children is None:
+            return
+        siblings = children.get(name)
+        if siblings is not None:
+            siblings.discard(node)
+            if not siblings:
+                del children[name]
+        if not children:
+            del self._children_by_name[parent]
+
+    def get_by_name(self, name):
+        """
+        Retrieve the nodes with a specific leaf name.
+
+        :param str name: A node name.
+        :return: A set of nodes
+        :rtype: set[MockedNode]
+        """
+        return self._nodes_by_name.get(name, frozenset())
+
+    def has_child(self, parent, name):
+        """
+        Determine if a node have a child with a specific name.
+
+        :param parent: A parent node. None for root nodes.
+        :type parent: MockedNode or None
+        :param str name: A node name.
+        :return: True if a child exist with this name. False otherwise.
+        :rtype: bool
+        """
+        children = self._children_by_name.get(parent)
+        return bool(children and children.get(name))
+
+    def iter_match(self, pattern):
+        """
+        Yield all the nodes which dagpath match the provided pattern.
+
+        The pattern is resolved one segment at a time.
+        Literal segments are resolved with a dict lookup,
+        only segments containing a wildcard (`*`) are enumerated.
+
+        :param str pattern: A node name, a partial dagpath or an absolute dagpath.
+        :return: A node generator
+        :rtype: Generator[MockedNode]
+        """
+        matcher = get_dagpath_matcher(pattern)
+        segments = matcher.segments
+
+        # An absolute dagpath start from the root of the scene.
+        # A partial dagpath can start anywhere in the hierarchy.
+        if matcher.absolute:
+            frontier = self._iter_children(None, segments[0])
+        else:
+            frontier = self._iter_named(segments[0])
+
+        for index, segment in enumerate(segments[1:]):
+            frontier = [
+                child
+                for parent in tuple(frontier)
+                for child in self._iter_children(parent, segment)
+            ]
+            # ex: '*|b' also match the root node '|b'
+            if index == 0 and matcher.optional_root:
+                frontier.extend(self._iter_children(None, segment))
+
+        for node in tuple(frontier):
+            yield node
+
+    def _iter_named(self, segment):
+        """
+        Yield nodes anywhere in the hierarchy which name match a pattern segment.
+
+        :param segment: A compiled pattern segment
+        :type segment: LiteralMatcher or RegexMatcher
+        """
+        return _iter_match_segment(self._nodes_by_name, segment)
+
+    def _iter_children(self, parent, segment):
+        """
+        Yield children of a node which name match a pattern segment.
+
+        :param parent: A parent node. None for root nodes.
+        :type parent: MockedNode or None
+        :param segment: A compiled pattern segment
+        :type segment: LiteralMatcher or RegexMatcher
+        """
+        children = self._children_by_name.get(parent)
+        if not children:
+            return iter(())
+        return _iter_match_segment(children, segment)
+
+
+def _iter_match_segment(nodes_by_name, segment):
+    """
+    Yield the nodes which name match a pattern segment.
+
+    :param nodes_by_name: A dict of nodes set by their names.
+    :type nodes_by_name: dict[str, set[MockedNode]]
+    :param segment: A compiled pattern segment
+    :type segment: LiteralMatcher or RegexMatcher
+    :return: A node generator
+    :rtype: Generator[MockedNode]
+    """
+    # Literal segments don't need to be enumerated
+    literal = segment.literal
+    if literal is not None:
+        for node in tuple(nodes_by_name.get(literal, ())):
+            yield node
+        return
+
+    for name, nodes in tuple(nodes_by_name.items()):
+        if segment.match(name):
+            for node in tuple(nodes):
+                yield node
+
+
+def _split_numeric_suffix(name):
+    """
+    Split a name in a prefix and a numeric suffix.
+
+    >>> _split_numeric_suffix('transform12')
+    ('transform', 12)
+    >>> _split_numeric_suffix('transform') is None
+    True
+
+    :param str name: A node name
+    :return: The name prefix and numeric suffix. None if the name have no numeric suffix
+    or if the suffix could not have been generated by a `NameAllocator` (ex: 'transform01').
+    :rtype: tuple[str, int] or None
+    """
+    if not name:
+        return None
+    prefix = name.rstrip(string.digits)
+    suffix = name[len(prefix) :]
+    if not suffix or suffix.startswith("0"):
+        return None
+    return prefix, int(suffix)
+
+
+class NameAllocator(object):
+    """
+    Allocate unique node names by appending a number to a prefix.
+
+    For each parent and prefix, we track the numeric suffixes in use
+    and the next suffix that might be free so we never have to count from 1.
+    Suffixes are counted since re-parenting can give the same name to multiple siblings.
+    """
+
+    def __init__(self, is_taken):
+        """
+        :param callable is_taken: A function that receive a parent and a name
+        and return True if the parent already have a child with this name.
+        Used for the prefixes that end with a digit since their name cannot be tracked.
+        """
+        self._is_taken = is_taken
+        self._suffixes = collections.defaultdict(collections.Counter)
+        self._next_suffix = {}
+
+        # Reserved names that are not used by a node yet, see `reserve`.
+        self._reserved = set()
+
+    def add(self, node):
+        """
+        Register a node name.
+
+        :param MockedNode node: The node to register.
+        """
+        self._add(node.parent, node.name)
+
+    def remove(self, node):
+        """
+        Unregister a node name.
+
+        :param MockedNode node: The node to unregister.
+        """
+        self._discard(node.parent, node.name)
+
+    def rename(self, node, old_name):
+        """
+        Update the allocator after a node was renamed.
+
+        :param MockedNode node: The renamed node.
+        :param str old_name: The previous name of the node.
+        """
+        self._discard(node.parent, old_name)
+        self.add(node)
+
+    def reparent(self, node, old_parent):
+        """
+        Update the allocator after a node changed parent.
+
+        :param MockedNode node: The re-parented node.
+        :param old_parent: The previous parent of the node.
+        :type old_parent: MockedNode or None
+        """
+        self._discard(old_parent, node.name)
+        self.add(node)
+
+    def _add(self, parent, name):
+        split = _split_numeric_suffix(name)
+        if not split:
+            return
+        prefix, suffix = split
+        key = parent, prefix
+
+        # A node using a reserved name take the reservation over.
+        if (key, suffix) in self._reserved:
+            self._reserved.discard((key, suffix))
+            return
+        self._suffixes[key][suffix] += 1
+
+    def _discard(self, parent, name):
+        split = _split_numeric_suffix(name)
+        if not split:
+            return
+        prefix, suffix = split
+        key = parent, prefix
+        suffixes = self._suffixes.get(key)
+        if suffixes is None:
+            return
+        count = suffixes.get(suffix, 0)
+        if count > 1:
+            suffixes[suffix] = count - 1
+            return
+        suffixes.pop(suffix, None)
+        if not suffixes:
+            del self._suffixes[key]
+            self._next_suffix.pop(key, None)
+        elif suffix < self._next_suffix.get(key, 1):
+            self._next_suffix[key] = suffix
+
+    def _is_used(self, parent, name):
+        """
+        Determine if a name is in use, either by a node or by a reservation.
+
+        :param parent: A parent node. None for root nodes.
+        :type parent: MockedNode or None
+        :param str name: A node name.
+        :rtype: bool
+        """
+        split = _split_numeric_suffix(name)
+        if split and split[1] in self._suffixes.get((parent, split[0]), ()):
+            return True
+        return self._is_taken(parent, name)
+
+    def allocate(self, prefix, parent=None):
+        """
+        Get the first available name for a prefix.
+        Note that the name is not reserved, a node need to be registered with it.
+
+        :param str prefix: The name prefix. ex: 'transform'
+        :param parent: The parent of the future node. None for root nodes.
+        :type parent: MockedNode or None
+        :return: A unique name. ex: 'transform1'
+        :rtype: str
+        """
+        key = parent, prefix
+        suffixes = self._suffixes.get(key, ())
+        suffix = self._next_suffix.get(key, 1)
+
+        # If the prefix end with a digit, some of it's names could be registered
+        # under another prefix. (ex: 'foo12' could be 'foo' + 12 or 'foo1' + 2)
+        check = not prefix or prefix[-1] in string.digits
+
+        while suffix in suffixes or (
+            check and self._is_used(parent, "%s%s" % (prefix, suffix))
+        ):
+            suffix += 1
+
+        self._next_suffix[key] = suffix
+        return "%s%s" % (prefix, suffix)
+
+    def reserve(self, prefix, count, parent=None):
+        """
+        Reserve multiple unique names at once.
+        Reserved names are never allocated again until a node using them is removed.
+
+        :param str prefix: The names prefix. ex: 'transform'
+        :param int count: The number of names to reserve.
+        :param parent: The parent of the future nodes. None for root nodes.
+        :type parent: MockedNode or None
+        :return: A list of unique names. ex: ['transform1', 'transform2']
+        :rtype: list[str]
+        """
+        names = []
+        for _ in range(count):
+            name = self.allocate(prefix, parent=parent)
+            self._add(parent, name)
+            name_prefix, suffix = _split_numeric_suffix(name)
+            self._reserved.add(((parent, name_prefix), suffix))
+            names.append(name)
+        return names
+
+
+def _get_port_alias_rank(port, alias):
+    """
+    Resolve the priority of a port alias.
+    A port long name have priority over a short name which have priority over a nice name.
+
+    :param MockedPort port: A port
+    :param str alias: One of the port names
+    :return: The alias priority. Lower is better.
+    :rtype: int
+    """
+    if port.name == alias:
+        return 0
+    if port.short_name == alias:
+        return 1
+    return 2
+
+
+class PortIndex(object):
+    """
+    Index of ports by their node and any of their names (long, short or nice name).
+    """
+
+    def __init__(self):
+        self._ports_by_alias = collections.defaultdict(dict)
+
+        # Index of ports by their long or short name, regardless of their node.
+        self._ports_by_name = collections.defaultdict(set)
+
+    def add(self, port):
+        """
+        Register a port in the index.
+
+        :param MockedPort port: The port to register.
+        """
+        aliases = self._ports_by_alias[port.node]
+        for alias in {port.name, port.short_name, port.nice_name}:
+            existing = aliases.get(alias)
+            if existing is None or _get_port_alias_rank(
+                port, alias
+            ) < _get_port_alias_rank(existing, alias):
+                aliases[alias] = port
+
+        for name in {port.name, port.short_name}:
+            self._ports_by_name[name].add(port)
+
+    def remove(self, port, siblings):
+        """
+        Unregister a port from the index.
+
+        :param MockedPort port: The port to unregister.
+        :param siblings: The other ports of the same node.
+        Used to resolve any alias shadowed by the removed port.
+        :type siblings: Iterable[MockedPort]
+        """
+        for name in {port.name, port.short_name}:
+            ports = self._ports_by_name.get(name)
+            if ports is not None:
+                ports.discard(port)
+                if not ports:
+                    del self._ports_by_name[name]
+
+        aliases = self._ports_by_alias.get(port.node)
+        if aliases is None:
+            return
+
+        for alias in {port.name, port.short_name, port.nice_name}:
+            if aliases.get(alias) is not port:
+                continue
+            del aliases[alias]
+            candidates = [
+                sibling
+                for sibling in siblings
+                if sibling is not port
+                and alias in (sibling.name, sibling.short_name, sibling.nice_name)
+            ]
+            if candidates:
+                aliases[alias] = min(
+                    candidates,
+                    key=lambda sibling, alias=alias: _get_port_alias_rank(
+                        sibling, alias
+                    ),
+                )
+
+        if not aliases:
+            del self._ports_by_alias[port.node]
+
+    def remove_node(self, node):
+        """
+        Unregister all the ports of a node.
+
+        :param MockedNode node: The node to unregister.
+        """
+        self._ports_by_alias.pop(node, None)
+
+    def get(self, node, name):
+        """
+        Retrieve a port from a node and any of it's names.
+
+        :param MockedNode node: The node to look into.
+        :param str name: The port long, short or nice name.
+        :return: A port. None if nothing is found.
+        :rtype: MockedPort or None
+        """
+        aliases = self._ports_by_alias.get(node)
+        if aliases is None:
+            return None
+        return aliases.get(name)
+
+    def iter_match(self, node, pattern):
+        """
+        Yield the ports of a node which long or short name match a pattern.
+        Note that like in Maya, nice names are not matched.
+
+        :param MockedNode node: The node to look into.
+        :param str pattern: A port name pattern. ex: 'translate*'
+        :return: A port generator
+        :rtype: Generator[MockedPort]
+        """
+        aliases = self._ports_by_alias.get(node)
+        if not aliases:
+            return
+
+        matcher = get_name_matcher(pattern)
+        if matcher.literal is not None:
+            port = aliases.get(matcher.literal)
+            if port is not None and _get_port_alias_rank(port, matcher.literal) < 2:
+                yield port
+            return
+
+        known = set()
+        for alias, port in tuple(aliases.items()):
+            if (
+                port not in known
+                and _get_port_alias_rank(port, alias) < 2
+                and matcher.match(alias)
+            ):
+                known.add(port)
+                yield port
+
+    def iter_match_any_node(self, pattern):
+        """
+        Yield the ports of any node which long or short name match a pattern.
+
+        :param str pattern: A port name pattern. ex: 'translate*'
+        :return: A port generator
+        :rtype: Generator[MockedPort]
+        """
+        matcher = get_name_matcher(pattern)
+        if matcher.literal is not None:
+            for port in tuple(self._ports_by_name.get(matcher.literal, ())):
+                yield port
+            return
+
+        known = set()
+        for name, ports in tuple(self._ports_by_name.items()):
+            if not matcher.match(name):
+                continue
+            for port in tuple(ports):
+                if port not in known:
+                    known.add(port)
+                    yield port
+
+
+class ConnectionIndex(object):
+    """
+    Index of connections by their source port, destination port or both.
+    """
+
+    def __init__(self):
+        self._outputs = collections.defaultdict(set)
+        self._inputs = collections.defaultdict(set)
+        self._connections_by_ports = {}
+
+    def add(self, connection):
+        """
+        Register a connection in the index.
+
+        :param MockedConnection connection: The connection to register.
+        """
+        src, dst = connection.src, connection.dst
+        self._outputs[src].add(connection)
+        self._inputs[dst].add(connection)
+        self._connections_by_ports[src, dst] = connection
+
+    def remove(self, connection):
+        """
+        Unregister a connection from the index.
+
+        :param MockedConnection connection: The connection to unregister.
+        """
+        src, dst = connection.src, connection.dst
+        _discard(self._outputs, src, connection)
+        _discard(self._inputs, dst, connection)
+        self._connections_by_ports.pop((src, dst), None)
+
+    def get(self, src, dst):
+        """
+        Retrieve the connection between two ports.
+
+        :param MockedPort src: The source port
+        :param MockedPort dst: The destination port
+        :return: An existing connection. None otherwise.
+        :rtype: MockedConnection or None
+        """
+        return self._connections_by_ports.get((src, dst))
+
+    def get_inputs(self, port):
+        """
+        :param MockedPort port: A port
+        :return: The connections that use the provided port as destination.
+        :rtype: tuple[MockedConnection]
+        """
+        return tuple(self._inputs.get(port, ()))
+
+    def get_outputs(self, port):
+        """
+        :param MockedPort port: A port
+        :return: The connections that use the provided port as source.
+        :rtype: tuple[MockedConnection]
+        """
+        return tuple(self._outputs.get(port, ()))
+
+
+def _discard(connections_by_port, port, connection):
+    """
+    Remove a connection from an adjacency set.
+
+    :param connections_by_port: A dict of connections by port.
+    :type connections_by_port: dict[MockedPort, set[MockedConnection]]
+    :param MockedPort port: The port
+    :param MockedConnection connection: The connection to remove.
+    """
+    connections = connections_by_port.get(port)
+    if connections is None:
+        return
+    connections.discard(connection)
+    if not connections:
+        del connections_by_port[port]
@@ -70,6 +70,9 @@ def get_attribute_info(node_type, attribute):
     attr_parent = attr_parents[0] if attr_parents else None
     attr_readable = cmds.attributeQuery(attribute, type=node_type, readable=True)
     attr_writable = cmds.attributeQuery(attribute, type=node_type, writable=True)
+    attr_keyable = cmds.attributeQuery(attribute, type=node_type, keyable=True)
+    attr_multi = cmds.attributeQuery(attribute, type=node_type, multi=True)
+    attr_connectable = cmds.attributeQuery(attribute, type=node_type, connectable=True)
 
     return {
         "port_type": attr_type,
@@ -78,6 +81,9 @@ def get_attribute_info(node_type, attribute):
         "parent": attr_parent,
         "readable": attr_readable,
         "writable": attr_writable,
+        "keyable": attr_keyable,
+        "multi": attr_multi,
+        "connectable": attr_connectable,
     }
 
 
@@ -0,0 +1,200 @@
+"""
+Compiled version of the schema json files.
+
+Parsing a json schema generated from Maya take a significant amount of time.
+The parsed data is saved next to the json file with `marshal` which load a lot faster.
+The compiled file is only used if the json file did not change since it was compiled.
+
+Each node type is marshaled separately so only the types in use need to be parsed.
+The compiled file layout is:
+
+- The magic bytes, see `_MAGIC`.
+- The size of the header as an unsigned 32-bits integer.
+- The marshaled header which contain:
+  - The key of the json file, see `_get_key`.
+  - The default state of the schema.
+  - The index of the node types, see `CompiledSchema.index`.
+- The marshaled data of each node type.
+
+Note that `marshal.load` read files one byte at a time,
+it is a lot faster to read the whole file and use `marshal.loads`.
+"""
+import logging
+import marshal
+import os
+import struct
+import sys
+import tempfile
+
+_LOG = logging.getLogger(__name__)
+
+# Bytes at the start of every compiled file.
+# Change the version number if the layout change.
+_MAGIC = b"MMSC0003"
+
+# Layout of the header size.
+_HEADER_SIZE = struct.Struct("<I")
+
+# The extension appended to the json file path.
+_EXTENSION = ".cache"
+
+
+def _get_umask():
+    """
+    :return: The file mode creation mask of the process.
+    :rtype: int
+    """
+    # The umask can only be read by changing it.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import, changing the umask while other threads create files is not safe.
+_FILE_MODE = 0o666 & ~_get_umask()
+
+
+def get_cache_path(path):
+    """
+    :param str path: The path to a json file
+    :return: The path to the compiled version of the json file.
+    :rtype: str
+    """
+    return path + _EXTENSION
+
+
+def _get_key(path):
+    """
+    Get what identify a version of a json file.
+    The marshal format is also specific to a python version.
+
+    :param str path: The path to a json file
+    :return: The python version and the file modification time and size.
+    :rtype: tuple
+    """
+    stat = os.stat(path)
+    return tuple(sys.version_info[:2]), stat.st_mtime, stat.st_size
+
+
+class CompiledSchema(object):
+    """
+    Content of a compiled schema file.
+
+    :param bytes content: The content of a compiled file.
+    :raise ValueError: If the content is not a compiled schema.
+    """
+
+    def __init__(self, content):
+        if not content.startswith(_MAGIC):
+            raise ValueError("Not a compiled schema")
+        start = len(_MAGIC) + _HEADER_SIZE.size
+        (size,) = _HEADER_SIZE.unpack_from(content, len(_MAGIC))
+        header = marshal.loads(content[start : start + size])
+
+        # The key of the json file, see `_get_key`.
+        self.key = header[0]
+
+        # The default state of the schema, see `MockedSessionSchema.default_state`.
+        self.default_state = header[1]
+
+        # The namespace, the classification and the position of the data
+        # of each node type relative to the end of the header.
+        self.index = header[2]
+
+        self._content = content
+        self._start = start + size
+
+    @classmethod
+    def compile(cls, key, data):
+        """
+        :param tuple key: The key of the json file, see `_get_key`.
+        :param dict data: The json data
+        :return: The compiled schema
+        :rtype: CompiledSchema
+        """
+        blobs = []
+        index = {}
+        offset = 0
+        for node_type, node_data in (data.get("nodes") or {}).items():
+            blob = marshal.dumps(node_data)
+            index[node_type] = (
+                node_data["namespace"],
+                node_data["classification"],
+                offset,
+                len(blob),
+            )
+            blobs.append(blob)
+            offset += len(blob)
+
+        header = marshal.dumps((key, data.get("default_state") or {}, index))
+        return cls(b"".join([_MAGIC, _HEADER_SIZE.pack(len(header)), header] + blobs))
+
+    def get_node_data(self, node_type):
+        """
+        :param str node_type: A node type
+        :return: The json data of the node type.
+        :rtype: dict
+        :raise KeyError: If the node type is unknown
+        """
+        _, _, offset, size = self.index[node_type]
+        start = self._start + offset
+        return marshal.loads(self._content[start : start + size])
+
+    def to_bytes(self):
+        """
+        :return: The content of the compiled file.
+        :rtype: bytes
+        """
+        return self._content
+
+
+def load(path):
+    """
+    Load the compiled version of a json file.
+
+    :param str path: The path to a json file
+    :return: The compiled schema. None if the json file was not compiled or changed since.
+    :rtype: CompiledSchema or None
+    """
+    try:
+        with open(get_cache_path(path), "rb") as stream:
+            compiled = CompiledSchema(stream.read())
+        if compiled.key != _get_key(path):
+            return None
+        return compiled
+    except (IOError, OSError, EOFError, ValueError, TypeError, struct.error) as error:
+        _LOG.debug("Cannot load compiled schema for %r: %s", path, error)
+        return None
+
+
+def dump(path, data):
+    """
+    Compile a json file and save the compiled version next to it.
+    Errors are ignored since the compiled file is not mandatory.
+
+    :param str path: The path to a json file
+    :param dict data: The json data
+    :return: The compiled schema
+    :rtype: CompiledSchema
+    """
+    compiled = CompiledSchema.compile(_get_key(path), data)
+
+    cache_path = get_cache_path(path)
+    try:
+        # Write to a temporary file first so other processes never read a partial file.
+        handle, path_tmp = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".")
+    except (IOError, OSError) as error:
+        _LOG.debug("Cannot save compiled schema for %r: %s", path, error)
+        return compiled
+
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            stream.write(compiled.to_bytes())
+        # Temporary files are only readable by their owner,
+        # give the compiled file the same permissions as any new file.
+        os.chmod(path_tmp, _FILE_MODE)
+        getattr(os, "replace", os.rename)(path_tmp, cache_path)
+    except (IOError, OSError, ValueError) as error:
+        _LOG.debug("Cannot save compiled schema for %r: %s", path, error)
+        os.remove(path_tmp)
+    return compiled
@@ -0,0 +1,191 @@
+"""
+Helpers of the MockedSession class.
+
+They are mixins that only rely on the session attributes,
+this keeps the session module to a reasonable size.
+"""
+import collections
+
+from maya_mock.base.matcher import get_name_matcher
+
+
+class StatsMixin(object):
+    """
+    Statistics of a session containers and query methods.
+    """
+
+    def stats(self):
+        """
+        Report the size of the session containers and how the query methods are used.
+        Useful to understand why a test is slow.
+
+        - `nodes`, `ports`, `connections`: The number of objects in the scene.
+        - `ports_by_node`: The number of entries in `ports_by_node`.
+        - `ports_by_node_stale`: The number of entries in `ports_by_node`
+          for nodes that don't exist anymore or don't have ports.
+        - `plug_cache`: The number of resolved plugs in cache.
+        - `dagpath_cache`: See `dagpath_cache_stats` and `dagpath_cache_hits`.
+        - `queries`: The calls, full linear scans and time in seconds by query method.
+          Time include the time spent consuming the returned generators
+          and the time spent in other query methods.
+
+        :return: The session statistics
+        :rtype: dict
+        """
+        result = self._get_container_stats()
+        result["plug_cache"] = len(self._plug_cache)
+        result["dagpath_cache"] = dict(
+            self.dagpath_cache_stats, hits=self.dagpath_cache_hits
+        )
+        result["queries"] = self._query_stats.info()
+        return result
+
+    def _get_container_stats(self):
+        """
+        :return: The size of the session containers, see `stats`.
+        :rtype: dict[str, int]
+        """
+        nodes = self.nodes
+        stale = sum(
+            1
+            for node, ports in self.ports_by_node.items()
+            if not ports or node not in nodes
+        )
+        return {
+            "nodes": len(nodes),
+            "ports": len(self.ports),
+            "connections": len(self.connections),
+            "ports_by_node": len(self.ports_by_node),
+            "ports_by_node_stale": stale,
+        }
+
+    def reset_stats(self):
+        """
+        Reset the query and dagpath cache statistics.
+        """
+        self._query_stats.clear()
+        self.dagpath_cache_stats.clear()
+        self.dagpath_cache_hits = 0
+
+
+class LazyPortsMixin(object):  # pylint: disable=too-few-public-methods
+    """
+    Schema ports of a node are only created when they are first needed.
+    """
+
+    def _get_schema_ports(self, node_type):
+        """
+        Get the schema ports of a node type.
+        Definitions are the schema ones so they are shared by all the sessions and node types.
+
+        :param str node_type: A node type
+        :return: The ports definitions by their name,
+        the ports names by any of their alias (long, short or nice name)
+        and the bitwise or of the ports flags.
+        :rtype: tuple[dict[str, AttributeDef], dict[str, tuple[str]], int]
+        """
+        try:
+            return self._schema_ports[node_type]
+        except KeyError:
+            pass
+
+        definitions = self.schema.get(node_type).attributes
+        aliases = collections.defaultdict(set)
+        flags = 0
+        for port_name, definition in definitions.items():
+            for alias in (definition.name, definition.short_name, definition.nice_name):
+                aliases[alias].add(port_name)
+            flags |= definition.flags
+        aliases = {alias: tuple(names) for alias, names in aliases.items()}
+
+        self._schema_ports[node_type] = result = (definitions, aliases, flags)
+        return result
+
+    def _is_schema_definition(self, port):
+        """
+        :param MockedPort port: A port
+        :return: True if the port definition is shared with the schema.
+        Other definitions are interned by the session.
+        :rtype: bool
+        """
+        node_type = port.node.type
+        if not self.schema or self.schema.get(node_type) is None:
+            return False
+        definitions, _, _ = self._get_schema_ports(node_type)
+        return definitions.get(port.name) is port.definition
+
+    def _materialize_ports(self, node, names):
+        """
+        Create schema ports of a node that don't exist yet.
+
+        :param MockedNode node: The node to create ports on.
+        :param names: The name of the schema ports to create.
+        :type names: Iterable[str]
+        """
+        handled = self._lazy_nodes.get(node)
+        if handled is None:
+            return
+
+        definitions, _, _ = self._get_schema_ports(node.type)
+        for name in names:
+            if name in handled:
+                continue
+            handled.add(name)
+            self.create_port(node, name, definition=definitions[name])
+
+        if len(handled) >= len(definitions):
+            self._forget_lazy_node(node)
+
+    def _materialize_ports_by_pattern(self, node, pattern):
+        """
+        Create the schema ports of a node which names match a pattern.
+
+        :param MockedNode node: The node to create ports on.
+        :param str pattern: A port name pattern. ex: 'translate*'
+        """
+        if node not in self._lazy_nodes:
+            return
+
+        _, aliases, _ = self._get_schema_ports(node.type)
+        matcher = get_name_matcher(pattern)
+        if matcher.literal is not None:
+            names = aliases.get(matcher.literal, ())
+        else:
+            names = {
+                name
+                for alias, names_ in aliases.items()
+                if matcher.match(alias)
+                for name in names_
+            }
+        self._materialize_ports(node, names)
+
+    def _materialize_node_ports(self, node):
+        """
+        Create all the schema ports of a node that don't exist yet.
+
+        :param MockedNode node: The node to create ports on.
+        """
+        if node in self._lazy_nodes:
+            definitions, _, _ = self._get_schema_ports(node.type)
+            self._materialize_ports(node, definitions)
+
+    def _materialize_all_ports(self):
+        """
+        Create all the schema ports that don't exist yet.
+        """
+        for node in tuple(self._lazy_nodes):
+            self._materialize_node_ports(node)
+
+    def _forget_lazy_node(self, node):
+        """
+        Stop tracking the schema ports of a node.
+
+        :param MockedNode node: A node
+        """
+        if self._lazy_nodes.pop(node, None) is None:
+            return
+        nodes = self._lazy_nodes_by_type.get(node.type)
+        if nodes is not None:
+            nodes.discard(node)
+            if not nodes:
+                del self._lazy_nodes_by_type[node.type]
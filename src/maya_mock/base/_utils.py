@@ -1,6 +1,13 @@
 """
 Various utility functions
 """
+import collections
+import functools
+import time
+import types
+
+# Most precise clock available. `time.perf_counter` is not available in python-2.
+_clock = getattr(time, "perf_counter", time.time)  # pylint: disable=invalid-name
 
 
 def handle_arguments(**mapping):
@@ -74,3 +81,270 @@ def redirect_method_args_to_arg(func):
         return func(self, args, **kwargs)
 
     return _wrapper
+
+
+class InternTable(object):
+    """
+    Store a single instance of equal strings.
+    Similar to `sys.intern` which does not support unicode strings in python-2.
+
+       >>> table = InternTable()
+       >>> a = table("".join(("trans", "form")))
+       >>> b = table("".join(("transf", "orm")))
+       >>> a is b
+       True
+
+    Each call count as a reference, strings are forgotten once every reference is released.
+
+       >>> table.release(a)
+       >>> "transform" in table
+       True
+       >>> table.release(b)
+       >>> "transform" in table
+       False
+    """
+
+    __slots__ = ("_data", "_counts")
+
+    def __init__(self):
+        self._data = {}
+        self._counts = {}
+
+    def __call__(self, value):
+        """
+        :param value: A string
+        :type value: str or None
+        :return: The first string equal to `value` that was provided to the table.
+        :rtype: str or None
+        """
+        if value is None:
+            return None
+        self._counts[value] = self._counts.get(value, 0) + 1
+        return self._data.setdefault(value, value)
+
+    def get(self, value):
+        """
+        Same as calling the table without adding a reference.
+
+        :param value: A string
+        :type value: str or None
+        :return: The shared string equal to `value` if any, otherwise `value`.
+        :rtype: str or None
+        """
+        return self._data.get(value, value)
+
+    def release(self, value):
+        """
+        Release a reference to a string returned by the table.
+        Unknown strings are ignored.
+
+        :param value: A string
+        :type value: str or None
+        """
+        count = self._counts.get(value)
+        if count is None:
+            return
+        if count > 1:
+            self._counts[value] = count - 1
+        else:
+            del self._counts[value]
+            del self._data[value]
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict.
+    Similar to `types.MappingProxyType` which is not available in python-2.
+
+       >>> data = FrozenDict({"a": 1})
+       >>> data["b"] = 2
+       Traceback (most recent call last):
+       ...
+       TypeError: FrozenDict is read-only
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *_, **__):
+        raise TypeError("%s is read-only" % type(self).__name__)
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def copy(self):
+        """
+        :return: A mutable copy
+        :rtype: dict
+        """
+        return dict(self)
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ("hits", "misses", "maxsize", "currsize")
+)
+
+
+class LRUCache(object):
+    """
+    Bounded cache that compute values on demand and evict the least recently used ones.
+    Similar to `functools.lru_cache` which is not available in python-2.
+
+       >>> cache = LRUCache(str.upper, maxsize=2)
+       >>> cache("a"), cache("b"), cache("a"), cache("c")
+       ('A', 'B', 'A', 'C')
+       >>> cache.info()
+       CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+    :param callable factory: A callable that compute the value associated with a key.
+    :param int maxsize: The maximum number of values to keep.
+    """
+
+    def __init__(self, factory, maxsize=1024):
+        self._factory = factory
+        self._data = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, key):
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            value = self._factory(key)
+            if len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+        else:
+            self.hits += 1
+
+        self._data[key] = value
+        return value
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        """
+        :return: The cache statistics
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """
+        Clear the cache content and statistics.
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+QueryInfo = collections.namedtuple("QueryInfo", ("calls", "scans", "time"))
+
+
+class QueryStats(object):
+    """
+    Count the calls, full linear scans and time spent in query methods.
+
+       >>> stats = QueryStats()
+       >>> stats.record("get_node_by_name", 0.5)
+       >>> stats.scan("get_node_by_name")
+       >>> stats.info()
+       {'get_node_by_name': QueryInfo(calls=1, scans=1, time=0.5)}
+    """
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.scans = collections.Counter()
+        self.time = collections.defaultdict(float)
+
+    def record(self, name, elapsed):
+        """
+        Register a call to a query method.
+
+        :param str name: The method name
+        :param float elapsed: The time spent in the method in seconds.
+        """
+        self.calls[name] += 1
+        self.time[name] += elapsed
+
+    def scan(self, name):
+        """
+        Register a full linear scan of the scene.
+
+        :param str name: The name of the method that did the scan.
+        """
+        self.scans[name] += 1
+
+    def info(self):
+        """
+        :return: The statistics by method name.
+        :rtype: dict[str, QueryInfo]
+        """
+        return {
+            name: QueryInfo(calls, self.scans[name], self.time[name])
+            for name, calls in self.calls.items()
+        }
+
+    def clear(self):
+        """
+        Reset the statistics.
+        """
+        self.calls.clear()
+        self.scans.clear()
+        self.time.clear()
+
+
+def track_query(func):
+    """
+    Decorator that record the calls of a session method in the session `_query_stats`.
+    If the method return a generator, the time spent consuming it is also recorded.
+
+    :param callable func: A session method.
+    :return: A wrapped method
+    :rtype: callable
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def _wrapper(self, *args, **kwargs):
+        stats = self._query_stats  # pylint: disable=protected-access
+        start = _clock()
+        result = func(self, *args, **kwargs)
+        stats.record(name, _clock() - start)
+        if isinstance(result, types.GeneratorType):
+            return _iter_timed(stats, name, result)
+        return result
+
+    return _wrapper
+
+
+def _iter_timed(stats, name, iterator):
+    """
+    Yield the values of an iterator and record the time spent producing them.
+
+    :param QueryStats stats: The statistics to update.
+    :param str name: The name of the method that returned the iterator.
+    :param iterator: An iterator
+    :return: A generator
+    :rtype: Generator
+    """
+    times = stats.time
+    while True:
+        start = _clock()
+        try:
+            value = next(iterator)
+        except StopIteration:
+            times[name] += _clock() - start
+            return
+        times[name] += _clock() - start
+        yield value
@@ -6,6 +6,8 @@ class MockedConnection(object):
     A mocked Maya connection.
     """
 
+    __slots__ = ("_port_src", "_port_dst", "_key")
+
     def __init__(self, port_src, port_dst):
         """
         :param maya_mock.MockedPort port_src: The connection source port.
@@ -19,14 +21,19 @@ class MockedConnection(object):
         self._port_src = port_src
         self._port_dst = port_dst
 
+        # Ports are hashed by identity, this key is stable even if their dagpath change.
+        self._key = (port_src, port_dst)
+
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        if not isinstance(other, MockedConnection):
+            return False
+        return self._key == other._key  # pylint: disable=protected-access
 
     def __ne__(self, other):
-        return hash(self) != hash(other)
+        return not self == other
 
     def __hash__(self):
-        return hash(self.src.dagpath + self.dst.dagpath)
+        return hash(self._key)
 
     def __repr__(self):
         return '<Mocked Connection "{}" "{}">'.format(self._port_src, self._port_dst)
@@ -31,6 +31,16 @@ BLACKLISTED_NODE_NAMES = (
 )
 
 
+# Bit flags of a port, see `maya_mock.base.port.AttributeDef.flags`.
+PORT_READABLE = 1 << 0
+PORT_WRITABLE = 1 << 1
+PORT_INTERESTING = 1 << 2
+PORT_USER_DEFINED = 1 << 3
+PORT_KEYABLE = 1 << 4
+PORT_MULTI = 1 << 5
+PORT_CONNECTABLE = 1 << 6
+
+
 # Theses types will always have a transform as their parent.
 # Theses classification type can be obtained using cmds.getClassification().
 SHAPE_CLASS = (
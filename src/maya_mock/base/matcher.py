@@ -0,0 +1,169 @@
+"""
+Compiled name and dagpath patterns.
+
+Patterns are compiled once into matcher objects and kept in a bounded cache.
+Patterns without any wildcard compile to literal matchers which
+let callers use equality or dict lookups instead of regular expressions.
+"""
+import fnmatch
+import re
+
+from maya_mock.base import naming
+from maya_mock.base._utils import LRUCache
+
+# Maximum number of compiled patterns to keep in each cache.
+CACHE_SIZE = 1024
+
+
+class LiteralMatcher(object):
+    """
+    Match a name against a pattern without any wildcard.
+    """
+
+    __slots__ = ("literal",)
+
+    def __init__(self, literal):
+        """
+        :param str literal: The exact name to match.
+        """
+        self.literal = literal
+
+    def __repr__(self):
+        return "<LiteralMatcher %r>" % self.literal
+
+    def match(self, name):
+        """
+        :param str name: A name to check
+        :return: True if the name match the pattern. False otherwise.
+        :rtype: bool
+        """
+        return name == self.literal
+
+
+class RegexMatcher(object):
+    """
+    Match a name against a pattern containing wildcards.
+    """
+
+    __slots__ = ("_regex",)
+
+    literal = None
+
+    def __init__(self, regex):
+        """
+        :param str regex: A regular expression.
+        """
+        self._regex = re.compile(regex)
+
+    def __repr__(self):
+        return "<RegexMatcher %r>" % self._regex.pattern
+
+    def match(self, name):
+        """
+        :param str name: A name to check
+        :return: True if the name match the pattern. False otherwise.
+        :rtype: bool
+        """
+        return self._regex.match(name) is not None
+
+
+class DagpathMatcher(object):  # pylint: disable=too-few-public-methods
+    """
+    A dagpath pattern split in segments.
+
+    - `name`: Match any node named `name`.
+    - `a|b`: Match any node named `b` with a parent named `a`.
+    - `|a|b`: Match the node named `b` with a root parent named `a`.
+    - `*|b`: A leading segment matching an empty name is optional,
+      this also match the root node named `b`.
+    """
+
+    __slots__ = ("absolute", "segments", "optional_root")
+
+    def __init__(self, pattern):
+        """
+        :param str pattern: A node name, a partial dagpath or an absolute dagpath.
+        """
+        self.absolute = pattern.startswith("|")
+        if self.absolute:
+            pattern = pattern[1:]
+        self.segments = tuple(_get_segment_matcher(seg) for seg in pattern.split("|"))
+        self.optional_root = (
+            not self.absolute and len(self.segments) > 1 and self.segments[0].match("")
+        )
+
+    def __repr__(self):
+        return "<DagpathMatcher %s>" % (self.segments,)
+
+
+def _compile_segment(segment):
+    """
+    :param str segment: A dagpath segment. ex: 'transform*'
+    :return: A matcher
+    :rtype: LiteralMatcher or RegexMatcher
+    """
+    if "*" not in segment:
+        return LiteralMatcher(segment)
+    return RegexMatcher(naming.segment_to_regex(segment))
+
+
+def _compile_name(pattern):
+    """
+    :param str pattern: A unix shell-style pattern. ex: 'translate*'
+    :return: A matcher
+    :rtype: LiteralMatcher or RegexMatcher
+    """
+    if not any(char in pattern for char in "*?["):
+        return LiteralMatcher(pattern)
+    return RegexMatcher(fnmatch.translate(pattern))
+
+
+_get_segment_matcher = LRUCache(_compile_segment, maxsize=CACHE_SIZE)
+_get_dagpath_matcher = LRUCache(DagpathMatcher, maxsize=CACHE_SIZE)
+_get_name_matcher = LRUCache(_compile_name, maxsize=CACHE_SIZE)
+
+_CACHES = {
+    "segment": _get_segment_matcher,
+    "dagpath": _get_dagpath_matcher,
+    "name": _get_name_matcher,
+}
+
+
+def get_dagpath_matcher(pattern):
+    """
+    Get a compiled dagpath pattern. Used to match nodes.
+
+    :param str pattern: A node name, a partial dagpath or an absolute dagpath.
+    :return: A compiled pattern
+    :rtype: DagpathMatcher
+    """
+    return _get_dagpath_matcher(pattern)
+
+
+def get_name_matcher(pattern):
+    """
+    Get a compiled unix shell-style pattern. Used to match port names.
+
+    :param str pattern: A pattern. ex: 'translate*'
+    :return: A matcher
+    :rtype: LiteralMatcher or RegexMatcher
+    """
+    return _get_name_matcher(pattern)
+
+
+def cache_info():
+    """
+    Get statistics about the compiled patterns caches.
+
+    :return: A dict of cache statistics by cache name.
+    :rtype: dict[str, maya_mock.base._utils.CacheInfo]
+    """
+    return {name: cache.info() for name, cache in _CACHES.items()}
+
+
+def clear_cache():
+    """
+    Clear all the compiled patterns caches and their statistics.
+    """
+    for cache in _CACHES.values():
+        cache.clear()
@@ -34,41 +34,20 @@ def join(left, right):
     return dagpath
 
 
-def pattern_to_regex(pattern):
+def segment_to_regex(segment):
     r"""
-    Convert a node dagpath to a regular expression (regex).
+    Convert a single dagpath segment (a node name pattern) to a regular expression (regex).
 
     Some example would be:
-    - 'name': r'(^|.*\|)name($|\|)'
-    - 'name*': r'(^|.*\|)name[\W_]+'($|\|)'
-    - 'a|b': r'(^|.*\|)a\|b($|\|)'
-    - '|a|b': r'^\|a\|b($|\|)'
-    - '|a': r'^\|a($|\|)'
+    - 'name': r'name$'
+    - 'name*': r'name[\w]*$'
 
-    :param pattern: The pattern to convert.
+    :param str segment: The segment to convert. Cannot contain any `|` character.
     :return: A regex string.
-    :rtype:string
+    :rtype: str
     """
-    # No pattern always match
-    if pattern is None:
-        return ".*"
-
-    # Replace '*' to it's regex equivalent
-    pattern = pattern.replace("*", r"[\w]*")
-
-    # Escape pipe character (replace '|' by '\|')
-    pattern = pattern.replace("|", r"\|")
-
-    # If the pattern start with a pipe, only check absolute dagpaths
-    if pattern.startswith("|"):
-        pattern = "^" + pattern
-    else:
-        pattern = r"(^|.*\|)" + pattern
-
-    # pattern += r'($|\|.*)'
-    pattern += r"$"
-
-    return pattern
+    parts = (re.escape(part) for part in segment.split("*"))
+    return r"[\w]*".join(parts) + "$"
 
 
 def is_valid_node_name(name):
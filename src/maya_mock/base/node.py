@@ -10,6 +10,17 @@ class MockedNode(_abstract.BaseDagObject):
     A mocked Maya node
     """
 
+    __slots__ = (
+        "_session",
+        "_name",
+        "type",
+        "_parent",
+        "_dagpath",
+        "_melobject",
+        "children",
+        "__weakref__",
+    )
+
     def __init__(self, session, node_type, name, parent=None):
         """
         :param maya_mock.MockedSession session: The parent session.
@@ -24,23 +35,16 @@ class MockedNode(_abstract.BaseDagObject):
         name = six.text_type(name) if name else None
 
         self._session = session
-        self.name = name
-        self.type = node_type
+        self._name = session.intern_name(name)
+        self.type = session.intern_name(node_type)
         self._parent = None
-        self.ports = (
-            set()
-        )  # internal REGISTRY_DEFAULT of ports associated with the node
+        self._dagpath = None  # cache, see `dagpath`
+        self._melobject = None  # cache, see `__melobject__`
         self.children = set()
 
         if parent:
             self.set_parent(parent)
 
-    def __hash__(self):
-        # Note: We can't use the dagpath as the hash source since it can change.
-        # This might prevent us from accessing a MockedNode that was stored in a dict
-        # before it was re-parented.
-        return object.__hash__(self)
-
     def __repr__(self):
         return '<Mocked Node "{}">'.format(self.dagpath)
 
@@ -49,6 +53,20 @@ class MockedNode(_abstract.BaseDagObject):
         Return the node mel representation.
         If multiple nodes exists with the same name, the dagpath will be returned instead.
 
+        The result is cached until the session invalidate it.
+        This happen when a node with the same name is added, removed, renamed or re-parented.
+
+        :return: The node name or dagpath.
+        :rtype: str
+        """
+        if self._melobject is None:
+            self._melobject = self._resolve_melobject()
+        return self._melobject
+
+    def _resolve_melobject(self):
+        """
+        Resolve the shortest pattern that only match this node.
+
         :return: The node name or dagpath.
         :rtype: str
         """
@@ -73,9 +91,76 @@ class MockedNode(_abstract.BaseDagObject):
         """
         In Maya, the dagpath is the unique identifier for the resource.
         Return the fully qualified dagpath.
+
+        The dagpath is cached until the node or one of it's parent is renamed or re-parented.
+        Hits are the hot path so they are counted with a plain integer instead of the counter.
+        """
+        dagpath = self._dagpath
+        if dagpath is None:
+            self._session.dagpath_cache_stats["misses"] += 1
+            prefix = self._parent.dagpath + "|" if self._parent else "|"
+            dagpath = self._dagpath = "{}{}".format(prefix, self.name)
+        else:
+            self._session.dagpath_cache_hits += 1
+        return dagpath
+
+    def iter_hierarchy(self):
+        """
+        Yield the node and all it's descendants.
+
+        :return: A node generator
+        :rtype: Generator[MockedNode]
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children)
+
+    def _invalidate_dagpath(self):
+        """
+        Invalidate the cached dagpath of the node and all it's children.
+        """
+        stats = self._session.dagpath_cache_stats
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # If a node dagpath is not cached, it's children dagpath cannot be either.
+            if node._dagpath is None:  # pylint: disable=protected-access
+                continue
+            node._dagpath = None  # pylint: disable=protected-access
+            stats["invalidations"] += 1
+            stack.extend(node.children)
+
+    @property
+    def name(self):
+        """
+        :return: The name of the node.
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Rename the node.
+        :param str name: The new name of the node.
+        """
+        name = six.text_type(name) if name else None
+        old_name = self._name
+        self._name = name
+        self._invalidate_dagpath()
+        self._session._on_node_renamed(  # pylint: disable=protected-access
+            self, old_name
+        )
+
+    @property
+    def ports(self):
+        """
+        :return: A snapshot of the ports associated with the node.
+        :rtype: frozenset[maya_mock.MockedPort]
         """
-        prefix = self._parent.dagpath + "|" if self._parent else "|"
-        return "{}{}".format(prefix, self.name)
+        return frozenset(self._session.get_node_ports(self))
 
     @property
     def parent(self):
@@ -90,11 +175,16 @@ class MockedNode(_abstract.BaseDagObject):
         Change the node parent.
         :param maya_mock.MockedNode parent: The new parent to set.
         """
-        if self._parent:
-            self._parent.children.discard(self)  # TODO: .remove instead of discard?
+        old_parent = self._parent
+        if old_parent:
+            old_parent.children.discard(self)  # TODO: .remove instead of discard?
         if parent:
             parent.children.add(self)
         self._parent = parent
+        self._invalidate_dagpath()
+        self._session._on_node_reparented(  # pylint: disable=protected-access
+            self, old_parent
+        )
 
     def get_port_by_name(self, name):
         """
@@ -104,10 +194,8 @@ class MockedNode(_abstract.BaseDagObject):
         :rtype: maya_mock.MockedPort or None
         """
         # TODO: Deprecate? This should be called forom the session
-        for port in self.ports:
-            if port.name == name:
-                return port
-        return None
+        port = self._session.get_node_port_by_name(self, name)
+        return port if port is not None and port.name == name else None
 
     def is_shape(self):
         """
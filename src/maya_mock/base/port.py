@@ -1,19 +1,167 @@
 """A mocked Maya port"""
-import fnmatch
+import collections
 
 import six
 
 from maya_mock.base import _abstract
+from maya_mock.base.matcher import get_name_matcher
+from maya_mock.base import constants
 from maya_mock.base.constants import EnumAttrTypes
 
 
-class MockedPort(
-    _abstract.BaseDagObject
-):  # pylint: disable=too-many-instance-attributes
+def _flag_property(flag):
+    """
+    Create a read-only property that test a bit of a port definition flags.
+
+    :param int flag: A bit flag. See the `PORT_*` constants.
+    :return: A property
+    :rtype: property
+    """
+
+    def _getter(self):
+        return bool(self.flags & flag)
+
+    return property(_getter)
+
+
+class AttributeDef(
+    collections.namedtuple(
+        "AttributeDef", ("name", "short_name", "nice_name", "type", "flags", "parent",),
+    )
+):
+    """
+    Immutable definition of a port.
+
+    The same definition is shared by every port created from a schema node type.
+    Boolean properties are packed in `flags`, see the `PORT_*` constants.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def create(
+        cls,
+        name,
+        port_type="long",
+        short_name=None,
+        nice_name=None,
+        readable=True,
+        writable=True,
+        interesting=True,
+        user_defined=True,
+        parent=None,
+        keyable=False,
+        multi=False,
+        connectable=True,
+    ):  # pylint: disable=too-many-arguments
+        """
+        Create a port definition.
+
+        :param name: The name of the port.
+        :param port_type: The type of the port. See maya_mock.constants.EnumAttrTypes
+        :param str short_name: The 'short' name of the port. (ex: transform.t)
+        :param str nice_name: The 'nice' name of the port. (ex: transform.translateMcTranslate)
+        :param readable: 1
+        :param writable:
+        :param interesting:
+        :param bool user_defined: Is the port is not standard for this type of node?
+        :param parent: An optional parent to the attribute. Parent need to exist.
+        :type parent: str or None
+        :param bool keyable: Can the port be keyed?
+        :param bool multi: Is the port an array?
+        :param bool connectable: Can the port be connected?
+        :return: A port definition
+        :rtype: AttributeDef
+        """
+        # Ensure provided name is unicode
+        name = six.text_type(name) if name else None
+        short_name = six.text_type(short_name) if short_name else None
+        nice_name = six.text_type(nice_name) if nice_name else None
+
+        flags = 0
+        for flag, enabled in (
+            (constants.PORT_READABLE, readable),
+            (constants.PORT_WRITABLE, writable),
+            (constants.PORT_INTERESTING, interesting),
+            (constants.PORT_USER_DEFINED, user_defined),
+            (constants.PORT_KEYABLE, keyable),
+            (constants.PORT_MULTI, multi),
+            (constants.PORT_CONNECTABLE, connectable),
+        ):
+            if enabled:
+                flags |= flag
+
+        return cls(
+            name,
+            short_name or name,
+            nice_name or name,
+            getattr(EnumAttrTypes, port_type),
+            flags,
+            parent,
+        )
+
+    readable = _flag_property(constants.PORT_READABLE)
+    writable = _flag_property(constants.PORT_WRITABLE)
+    interesting = _flag_property(constants.PORT_INTERESTING)
+    user_defined = _flag_property(constants.PORT_USER_DEFINED)
+    keyable = _flag_property(constants.PORT_KEYABLE)
+    multi = _flag_property(constants.PORT_MULTI)
+    connectable = _flag_property(constants.PORT_CONNECTABLE)
+
+    def intern(self, table):
+        """
+        Get an equivalent definition which names are shared through an interning table.
+
+        :param callable table: A callable that return the shared instance of a string.
+        See `maya_mock.base._utils.InternTable`.
+        :return: A port definition
+        :rtype: AttributeDef
+        """
+        return self._replace(
+            name=table(self.name),
+            short_name=table(self.short_name),
+            nice_name=table(self.nice_name),
+            parent=table(self.parent),
+        )
+
+    def release(self, table):
+        """
+        Release the names of a definition returned by `intern`.
+
+        :param table: The interning table the definition was interned with.
+        :type table: maya_mock.base._utils.InternTable
+        """
+        for name in (self.name, self.short_name, self.nice_name, self.parent):
+            table.release(name)
+
+
+def _definition_property(name):
+    """
+    Create a read-only property that read an attribute of a port definition.
+
+    :param str name: The name of the `AttributeDef` field.
+    :return: A property
+    :rtype: property
+    """
+
+    def _getter(self):
+        return getattr(self.definition, name)
+
+    _getter.__name__ = name
+    _getter.__doc__ = "See `AttributeDef`."
+    return property(_getter)
+
+
+class MockedPort(_abstract.BaseDagObject):
     """
     A mocked Maya port.
+
+    A port only hold it's node and value.
+    Everything else is read from it's definition which can be shared between ports.
     """
 
+    __slots__ = ("node", "definition", "value", "__weakref__")
+
     def __init__(
         self,
         node,
@@ -27,6 +175,10 @@ class MockedPort(
         interesting=True,
         user_defined=True,
         parent=None,
+        keyable=False,
+        multi=False,
+        connectable=True,
+        definition=None,
     ):  # pylint: disable=too-many-arguments
         """
         Create a Maya port mock.
@@ -43,25 +195,48 @@ class MockedPort(
         :param bool user_defined: Is the port is not standard for this type of node?
         :param parent: An optional parent to the attribute. Parent need to exist.
         :type parent: str or None
+        :param bool keyable: Can the port be keyed?
+        :param bool multi: Is the port an array?
+        :param bool connectable: Can the port be connected?
+        :param definition: An existing definition to share with other ports.
+        If provided, all the other arguments except `node` and `value` are ignored.
+        :type definition: AttributeDef or None
         """
         super(MockedPort, self).__init__()
 
-        # Ensure provided name is unicode
-        name = six.text_type(name) if name else None
-        short_name = six.text_type(short_name) if short_name else None
-        nice_name = six.text_type(nice_name) if nice_name else None
+        if definition is None:
+            definition = AttributeDef.create(
+                name,
+                port_type=port_type,
+                short_name=short_name,
+                nice_name=nice_name,
+                readable=readable,
+                writable=writable,
+                interesting=interesting,
+                user_defined=user_defined,
+                parent=parent,
+                keyable=keyable,
+                multi=multi,
+                connectable=connectable,
+            )
 
         self.node = node
-        self.name = name
-        self.short_name = short_name or name
-        self.nice_name = nice_name or name
-        self._type = getattr(EnumAttrTypes, port_type)
+        self.definition = definition
         self.value = value
-        self.readable = readable
-        self.writable = writable
-        self.interesting = interesting
-        self.user_defined = user_defined
-        self.parent = parent
+
+    name = _definition_property("name")
+    short_name = _definition_property("short_name")
+    nice_name = _definition_property("nice_name")
+    type = _definition_property("type")
+    flags = _definition_property("flags")
+    readable = _definition_property("readable")
+    writable = _definition_property("writable")
+    interesting = _definition_property("interesting")
+    user_defined = _definition_property("user_defined")
+    parent = _definition_property("parent")
+    keyable = _definition_property("keyable")
+    multi = _definition_property("multi")
+    connectable = _definition_property("connectable")
 
     def __repr__(self):
         return '<Mocked Port "{}.{}">'.format(self.node.name, self.name)
@@ -69,13 +244,6 @@ class MockedPort(
     def __melobject__(self):
         return "{}.{}".format(self.node.__melobject__(), self.name)
 
-    @property
-    def type(self):
-        """
-        rtype: EnumAttrTypes
-        """
-        return self._type
-
     def match(self, pattern):
         """
         Check if the node match a certain pattern.
@@ -94,25 +262,19 @@ class MockedPort(
 
         # Match fully qualified dagpath
         # TODO: Make more solid
-        dagpath = self.dagpath
-        if dagpath == "|" + pattern:
-            return True
-
-        dagpath_short = self.dagpath_short
-        if dagpath_short == "|" + pattern:
-            return True
+        # Note that a dagpath always contain a '.', no need to build it otherwise.
+        if "." in pattern:
+            dagpath = self.dagpath
+            if dagpath == "|" + pattern:
+                return True
 
-        port_name = self.name
-        port_short_name = self.short_name
+            dagpath_short = self.dagpath_short
+            if dagpath_short == "|" + pattern:
+                return True
 
         # Match attribute name
-        if port_name == pattern or fnmatch.fnmatch(port_name, pattern):
-            return True
-
-        if port_short_name == pattern or fnmatch.fnmatch(port_short_name, pattern):
-            return True
-
-        return False
+        matcher = get_name_matcher(pattern)
+        return matcher.match(self.name) or matcher.match(self.short_name)
 
     @property
     def dagpath(self):
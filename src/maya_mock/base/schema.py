@@ -2,10 +2,17 @@
 Schema related classes.
 A schema hold information about maya default state, including default node types.
 """
-import copy
+import bisect
+import collections
 import logging
 import json
 
+import six
+
+from maya_mock.base import _schema_cache
+from maya_mock.base._utils import FrozenDict, InternTable
+from maya_mock.base.port import AttributeDef
+
 _LOG = logging.getLogger(__name__)
 
 
@@ -74,13 +81,80 @@ def iter_namespaces(namespaces):
             yield yielded
 
 
-class NodeTypeDef(object):
+class AttributeRecords(object):
+    """
+    Shared instances of the attributes data of a schema.
+
+    The same attributes are found on a lot of node types.
+    Equal attributes data are stored once as read-only dicts
+    and the definitions created from them are shared by all the node types.
+    """
+
+    def __init__(self):
+        self._names = InternTable()
+        self._records = {}
+        self._definitions = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def get_record(self, data):
+        """
+        :param dict data: The data of an attribute
+        :return: A shared read-only dict equal to the provided data.
+        :rtype: FrozenDict
+        """
+        key = frozenset(data.items())
+        try:
+            return self._records[key]
+        except KeyError:
+            record = FrozenDict(
+                (
+                    name,
+                    self._names(value)
+                    if isinstance(value, six.string_types)
+                    else value,
+                )
+                for name, value in data.items()
+            )
+            self._records[key] = record
+            return record
+
+    def get_name(self, name):
+        """
+        :param str name: An attribute name
+        :return: The shared instance of the name.
+        :rtype: str
+        """
+        return self._names(name)
+
+    def get_definition(self, name, record):
+        """
+        :param str name: An attribute name
+        :param FrozenDict record: A record returned by `get_record`.
+        :return: A definition shared by all the attributes with the same name and data.
+        :rtype: maya_mock.base.port.AttributeDef
+        """
+        # Records are kept alive by the table so their id cannot be reused.
+        key = name, id(record)
+        try:
+            return self._definitions[key]
+        except KeyError:
+            definition = AttributeDef.create(name, user_defined=False, **record)
+            self._definitions[key] = definition
+            return definition
+
+
+class NodeTypeDef(object):  # pylint: disable=too-many-instance-attributes
     """
     Object that hold information about a specific node type.
+
+    Inherited attributes are resolved once when the type is created,
+    this mean that a type parent need to be complete before the type is created.
     """
 
     def __init__(
-        self, namespace, data, classification, abstract=False, parent=None
+        self, namespace, data, classification, abstract=False, parent=None, records=None
     ):  # pylint: disable=too-many-arguments
         """
         :param str namespace: The node namespace.
@@ -90,21 +164,37 @@ class NodeTypeDef(object):
         - v is a dict containing the necessary information to build this port
         :param tuple(str) classification: The classification of the type.
         As returned by cmds.getClassification.
+        :param records: The attributes records to share the attributes data with.
+        Default to the records of the parent type.
+        :type records: AttributeRecords or None
         """
+        if records is None:
+            records = parent.records if parent else AttributeRecords()
+
         # Don't store the same attribute twice
-        if parent:
-            for key in parent.data.keys():
-                if key not in data:
-                    _LOG.debug("Cannot find %r in %r", key, parent)
-                    continue
-                data.pop(key)
+        inherited = parent.data if parent else FrozenDict()
+        data = FrozenDict(
+            (records.get_name(name), records.get_record(port_data))
+            for name, port_data in data.items()
+            if name not in inherited
+        )
 
         self.parent = parent
         self.namespace = namespace
         self.type = get_namespace_leaf(namespace)
+        self.records = records
         self._data = data
         self.classification = classification
         self.abstract = abstract
+        self._attributes = None  # cache, see `attributes`
+
+        # Own and inherited attributes, see `data`.
+        if inherited:
+            flattened = dict(inherited)
+            flattened.update(data)
+            self._flattened = FrozenDict(flattened)
+        else:
+            self._flattened = data
 
     def __repr__(self):
         return "<NodeTypeDef %r>" % self.type
@@ -123,25 +213,27 @@ class NodeTypeDef(object):
             (...)
         }
 
-        :return:
+        :return: A read-only dict
         :rtype: dict(str, dict)
         """
-        # TODO: memoize
-        if self.parent:
-            result = copy.copy(self._data)
-            result.update(self.parent.data)
-            return result
-        return self._data
+        return self._flattened
 
-    def apply(self, session, node):
+    @property
+    def attributes(self):
         """
-        Create the ports on a provided mocked node.
+        Definitions of all the attributes associated with this node, including inherited ones.
+        Definitions are created once and shared by all the ports created from this type.
+        Inherited definitions are shared with the parent type.
 
-        :param maya_mock.MockedSession session: The mocked session.
-        :param maya_mock.MockedNode node: The node to add ports to.
+        :return: A read-only dict of port definitions by port name.
+        :rtype: dict(str, maya_mock.base.port.AttributeDef)
         """
-        for port_name, port_data in self.data.items():
-            session.create_port(node, port_name, user_defined=False, **port_data)
+        if self._attributes is None:
+            attributes = dict(self.parent.attributes) if self.parent else {}
+            for port_name, record in self._data.items():
+                attributes[port_name] = self.records.get_definition(port_name, record)
+            self._attributes = FrozenDict(attributes)
+        return self._attributes
 
     def to_dict(self):
         """
@@ -156,11 +248,15 @@ class NodeTypeDef(object):
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, parent=None, records=None):
         """
         Construct an instance from a data dict.
 
         :param dict data: A dict
+        :param parent: The parent type if any.
+        :type parent: NodeTypeDef or None
+        :param records: The attributes records to share the attributes data with.
+        :type records: AttributeRecords or None
         :return: An instance
         :rtype: NodeTypeDef
         """
@@ -168,7 +264,331 @@ class NodeTypeDef(object):
         attributes = data["attributes"]
         classification = data["classification"]
         abstract = data.get("abstract", False)
-        return cls(namespace, attributes, classification, abstract=abstract)
+        return cls(
+            namespace,
+            attributes,
+            classification,
+            abstract=abstract,
+            parent=parent,
+            records=records,
+        )
+
+
+def _find_parent_namespace(namespace, known):
+    """
+    Find the closest ancestor of a namespace in a collection of namespaces.
+
+    >>> _find_parent_namespace('a.b.c', {'a'})
+    'a'
+
+    :param str namespace: A node type namespace
+    :param known: The known namespaces
+    :type known: Container[str]
+    :return: The closest known ancestor. None if no ancestor is known.
+    :rtype: str or None
+    """
+    parent_namespace = get_namespace_parent(namespace)
+    while parent_namespace and parent_namespace not in known:
+        parent_namespace = get_namespace_parent(parent_namespace)
+    return parent_namespace
+
+
+class _LazyNodeTypes(collections.MutableMapping):
+    """
+    Node types of a compiled schema by their name.
+    A node type and it's ancestors are only created when it is first accessed.
+
+    :param maya_mock.base._schema_cache.CompiledSchema compiled: A compiled schema.
+    """
+
+    def __init__(self, compiled):
+        self._compiled = compiled
+
+        # Attributes data shared by the node types.
+        self._records = AttributeRecords()
+
+        # Node types created so far or registered after the schema was loaded.
+        self._nodes = {}
+
+        # Node types of the compiled schema that were unregistered.
+        self._removed = set()
+
+        # Node type name by namespace for the compiled node types.
+        self._types_by_namespace = {
+            namespace: node_type
+            for node_type, (namespace, _, _, _) in compiled.index.items()
+        }
+
+    def __getitem__(self, node_type):
+        try:
+            return self._nodes[node_type]
+        except KeyError:
+            pass
+        if node_type in self._removed:
+            raise KeyError(node_type)
+
+        node_data = self._compiled.get_node_data(node_type)
+
+        # Unregistered ancestors are skipped like if they were not in the json data.
+        parent = None
+        parent_namespace = get_namespace_parent(node_data["namespace"])
+        while parent_namespace:
+            parent_type = self._types_by_namespace.get(parent_namespace)
+            if parent_type is not None and parent_type not in self._removed:
+                parent = self[parent_type]
+                break
+            parent_namespace = get_namespace_parent(parent_namespace)
+
+        node_def = NodeTypeDef.from_dict(
+            node_data, parent=parent, records=self._records
+        )
+        self._nodes[node_type] = node_def
+        return node_def
+
+    def __setitem__(self, node_type, node_def):
+        self._nodes[node_type] = node_def
+        self._removed.discard(node_type)
+
+    def __delitem__(self, node_type):
+        if node_type not in self:
+            raise KeyError(node_type)
+        self._nodes.pop(node_type, None)
+        if node_type in self._compiled.index:
+            self._removed.add(node_type)
+
+    def __contains__(self, node_type):
+        if node_type in self._nodes:
+            return True
+        return node_type in self._compiled.index and node_type not in self._removed
+
+    def __iter__(self):
+        for node_type in self._compiled.index:
+            if node_type not in self._removed:
+                yield node_type
+        for node_type in self._nodes:
+            if node_type not in self._compiled.index:
+                yield node_type
+
+    def __len__(self):
+        index = self._compiled.index
+        added = sum(1 for node_type in self._nodes if node_type not in index)
+        return len(index) - len(self._removed) + added
+
+    def iter_entries(self):
+        """
+        Yield the namespace and classification of the node types without creating them.
+
+        :return: A generator of node type, namespace and classification.
+        :rtype: Generator[tuple[str, str, str]]
+        """
+        index = self._compiled.index
+        for node_type in self:
+            node_def = self._nodes.get(node_type)
+            if node_def is None:
+                namespace, classification, _, _ = index[node_type]
+                yield node_type, namespace, classification
+            else:
+                yield node_type, node_def.namespace, node_def.classification
+
+
+def _iter_prefixed(pairs, prefix):
+    """
+    Yield the values of a sorted list of key and value pairs which key start with a prefix.
+
+    >>> list(_iter_prefixed([('a', 1), ('ab', 2), ('abc', 3), ('b', 4)], 'ab'))
+    [2, 3]
+
+    :param pairs: A sorted list of key and value pairs.
+    :type pairs: list[tuple[str, object]]
+    :param str prefix: A key prefix
+    :return: A generator of the matching values
+    :rtype: Generator
+    """
+    start = bisect.bisect_left(pairs, (prefix,))
+    for key, value in pairs[start:]:
+        if not key.startswith(prefix):
+            return
+        yield value
+
+
+def _iter_classification(classification):
+    """
+    >>> list(_iter_classification('drawdb/geometry'))
+    ['drawdb/geometry']
+    >>> list(_iter_classification(None))
+    []
+
+    :param classification: The classification of a node type.
+    :type classification: str or list[str] or None
+    :return: The classification entries
+    :rtype: Iterable[str]
+    """
+    if isinstance(classification, six.string_types):
+        return (classification,)
+    return classification or ()
+
+
+class _NodeTypes(collections.MutableMapping):
+    """
+    Node types of a schema by their name.
+    Wrap the mapping provided to the schema so it's indexes are invalidated when it change.
+
+    :param data: The wrapped mapping.
+    :type data: MutableMapping(str, NodeTypeDef)
+    :param callable on_change: Called when a node type is added, replaced or removed.
+    """
+
+    def __init__(self, data, on_change):
+        self.data = data
+        self._on_change = on_change
+
+    def __getitem__(self, node_type):
+        return self.data[node_type]
+
+    def __setitem__(self, node_type, node_def):
+        self.data[node_type] = node_def
+        self._on_change()
+
+    def __delitem__(self, node_type):
+        del self.data[node_type]
+        self._on_change()
+
+    def __contains__(self, node_type):
+        return node_type in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, node_type, default=None):
+        """
+        Get a node type without going through `__getitem__`,
+        a lazily loaded mapping can look it up directly.
+
+        :param str node_type: A node type name
+        :param default: The value to return if the node type is unknown.
+        :return: The node type definition
+        :rtype: NodeTypeDef or None
+        """
+        return self.data.get(node_type, default)
+
+    def iter_entries(self):
+        """
+        Yield the namespace and classification of the node types.
+
+        :return: A generator of node type, namespace and classification.
+        :rtype: Generator[tuple[str, str, str]]
+        """
+        iter_entries = getattr(self.data, "iter_entries", None)
+        if iter_entries:
+            return iter_entries()
+        return (
+            (node_type, node_def.namespace, node_def.classification)
+            for node_type, node_def in self.data.items()
+        )
+
+
+class _NodeTypeIndex(object):
+    """
+    Index of node types by their namespace and classification.
+
+    Namespaces and classifications are kept sorted so the descendants of a type
+    and the types with a classification prefix can be found with a binary search.
+    """
+
+    def __init__(self):
+        self._types_by_namespace = {}
+        self._namespaces_by_type = {}
+
+        # Sorted namespace and node type pairs
+        self._namespaces = []
+
+        # Sorted classification and node type pairs
+        self._classifications = []
+
+    @classmethod
+    def from_entries(cls, entries):
+        """
+        Build an index from existing node types.
+
+        :param entries: The node types with their namespace and classification.
+        :type entries: Iterable[tuple[str, str, str or list[str] or None]]
+        :return: An index
+        :rtype: _NodeTypeIndex
+        """
+        index = cls()
+        for node_type, namespace, classification in entries:
+            index._types_by_namespace[namespace] = node_type
+            index._namespaces_by_type[node_type] = namespace
+            index._namespaces.append((namespace, node_type))
+            for entry in _iter_classification(classification):
+                index._classifications.append((entry, node_type))
+
+        # Sorting once is a lot faster than keeping the lists sorted on each insertion.
+        index._namespaces.sort()
+        index._classifications.sort()
+        return index
+
+    def add(self, node_type, namespace, classification):
+        """
+        Register a node type.
+
+        :param str node_type: A node type
+        :param str namespace: The namespace of the node type.
+        :param classification: The classification of the node type.
+        :type classification: str or list[str] or None
+        """
+        self._types_by_namespace[namespace] = node_type
+        self._namespaces_by_type[node_type] = namespace
+        bisect.insort(self._namespaces, (namespace, node_type))
+        for entry in _iter_classification(classification):
+            bisect.insort(self._classifications, (entry, node_type))
+
+    def get_type(self, namespace):
+        """
+        :param str namespace: A node type namespace
+        :return: The node type with this namespace. None if the namespace is unknown.
+        :rtype: str or None
+        """
+        return self._types_by_namespace.get(namespace)
+
+    def get_ancestors(self, node_type):
+        """
+        :param str node_type: A node type
+        :return: The known ancestors of a node type, starting from the root.
+        :rtype: list[str]
+        """
+        namespace = self._namespaces_by_type.get(node_type)
+        if namespace is None:
+            return []
+        segments = namespace.split(".")
+        namespaces = (".".join(segments[:i]) for i in range(1, len(segments)))
+        return [
+            self._types_by_namespace[namespace_]
+            for namespace_ in namespaces
+            if namespace_ in self._types_by_namespace
+        ]
+
+    def get_descendants(self, node_type):
+        """
+        :param str node_type: A node type
+        :return: The known descendants of a node type in namespace order.
+        :rtype: list[str]
+        """
+        namespace = self._namespaces_by_type.get(node_type)
+        if namespace is None:
+            return []
+        return list(_iter_prefixed(self._namespaces, namespace + "."))
+
+    def get_by_classification(self, prefix):
+        """
+        :param str prefix: A classification prefix. ex: 'drawdb/geometry'
+        :return: The node types which classification start with the prefix.
+        :rtype: list[str]
+        """
+        return list(_iter_prefixed(self._classifications, prefix))
 
 
 class MockedSessionSchema(object):
@@ -181,27 +601,60 @@ class MockedSessionSchema(object):
         :param nodes: An optional dict(k,v) for registered nodes where:
         - k is the name of the node type
         - v is the node type definition.
-        :type nodes: dict(str, NodeTypeDef) or None
+        :type nodes: MutableMapping(str, NodeTypeDef) or None
         :param default_state: An optional dict(k,v) for default nodes in an empty scene where:
         - k is the name of the node
         - v is the type of the node
         :type default_state: dict(str, str) or None
         """
-        if nodes and not isinstance(nodes, dict):
+        if nodes and not isinstance(nodes, collections.MutableMapping):
             raise ValueError(
                 "Cannot initialize a schema from %s: %r" % (type(nodes), nodes)
             )
+        self._index = None  # cache, see `_get_index`
+        self._nodes = None
         self.nodes = nodes or {}
         self.default_state = default_state or {}
 
+    @property
+    def nodes(self):
+        """
+        :return: The registered node types by their name.
+        :rtype: MutableMapping(str, NodeTypeDef)
+        """
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes):
+        self._nodes = _NodeTypes(nodes, self._invalidate_index)
+        self._invalidate_index()
+
     def register_node(self, node):
         """
         :param NodeTypeDef node: The node type to register.
         """
-        if node.type in self.nodes:
+        if node.type in self._nodes:
             raise Exception("Node type %r is already registered!" % node.type)
 
-        self.nodes[node.type] = node
+        # Update the index instead of invalidating it.
+        self._nodes.data[node.type] = node
+        if self._index is not None:
+            self._index.add(node.type, node.namespace, node.classification)
+
+    def _invalidate_index(self):
+        self._index = None
+
+    def _get_index(self):
+        """
+        Get the index of the node types by namespace and classification.
+        The index is built on first use, updated by `register_node`
+        and built again if `nodes` is modified directly.
+
+        :rtype: _NodeTypeIndex
+        """
+        if self._index is None:
+            self._index = _NodeTypeIndex.from_entries(self._nodes.iter_entries())
+        return self._index
 
     def get(self, node_type):
         """
@@ -222,14 +675,34 @@ class MockedSessionSchema(object):
         :return: A node definition or None if namespace is unknown
         :rtype: NodeTypeDef or None
         """
-        return next(
-            (
-                node
-                for namespace_, node in self.nodes.items()
-                if namespace == namespace_
-            ),
-            None,
-        )
+        node_type = self._get_index().get_type(namespace)
+        return None if node_type is None else self.nodes.get(node_type)
+
+    def get_node_type_ancestors(self, node_type):
+        """
+        :param str node_type: A node type
+        :return: The types the node type inherit from, starting from the root type.
+        :rtype: list[str]
+        """
+        return self._get_index().get_ancestors(node_type)
+
+    def get_node_type_descendants(self, node_type):
+        """
+        :param str node_type: A node type
+        :return: The types that inherit from the node type.
+        :rtype: list[str]
+        """
+        return self._get_index().get_descendants(node_type)
+
+    def get_node_types_by_classification(self, prefix):
+        """
+        Get the node types which classification start with a prefix.
+
+        :param str prefix: A classification prefix. ex: 'drawdb/geometry'
+        :return: The matching node types.
+        :rtype: list[str]
+        """
+        return self._get_index().get_by_classification(prefix)
 
     def get_known_node_types(self):
         """
@@ -267,8 +740,23 @@ class MockedSessionSchema(object):
         nodes = data.get("nodes") or {}
         default_state = data.get("default_state") or {}
 
+        # Create the parent types first so inheritance is resolved in a single pass.
+        data_by_namespace = {
+            node_data["namespace"]: node_data for node_data in nodes.values()
+        }
+        node_defs = {}
+        records = AttributeRecords()
+        for namespace in iter_namespaces(sorted(data_by_namespace)):
+            node_data = data_by_namespace.get(namespace)
+            if node_data is None:
+                continue
+            parent_namespace = _find_parent_namespace(namespace, node_defs)
+            node_defs[namespace] = NodeTypeDef.from_dict(
+                node_data, parent=node_defs.get(parent_namespace), records=records
+            )
+
         nodes = {
-            node_name: NodeTypeDef.from_dict(node_data)
+            node_name: node_defs[node_data["namespace"]]
             for node_name, node_data in nodes.items()
         }
 
@@ -277,18 +765,29 @@ class MockedSessionSchema(object):
         return inst
 
     @classmethod
-    def from_json_file(cls, path):
+    def from_json_file(cls, path, compiled=True):
         """
         Load a Schema from a json file.
 
         :param str path: The absolute path to a json file.
+        :param bool compiled: If True, the json file is compiled the first time it is loaded
+            and the compiled version is used as long as the json file don't change.
+            The compiled file is saved next to the json file.
+            Node types are only created from the compiled file when they are first used.
         :return: A new MockedSessionSchema instance
         :rtype: MockedSessionSchema
         """
-        with open(path) as stream:
-            data = json.load(stream)
-
-        return cls.from_dict(data)
+        data = None
+        cache = _schema_cache.load(path) if compiled else None
+        if cache is None:
+            with open(path) as stream:
+                data = json.load(stream)
+            if compiled:
+                cache = _schema_cache.dump(path, data)
+
+        if cache is None:
+            return cls.from_dict(data)
+        return cls(nodes=_LazyNodeTypes(cache), default_state=cache.default_state)
 
     def to_json_file(self, path, indent=1, sort_keys=True, **kwargs):
         """
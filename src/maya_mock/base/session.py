@@ -2,15 +2,22 @@
 Session class which hold informations about current nodes, ports and connections.
 """
 import collections
-import itertools
 import logging
-import re
 import string
 
 import six
 
-from maya_mock.base import naming
+from maya_mock.base._columns import NodeColumns
+from maya_mock.base._utils import InternTable, QueryStats, track_query
+from maya_mock.base._index import (
+    DagIndex,
+    PortIndex,
+    ConnectionIndex,
+    NameAllocator,
+)
 from maya_mock.base.connection import MockedConnection
+from maya_mock.base._session_mixins import LazyPortsMixin, StatsMixin
+from maya_mock.base.matcher import get_dagpath_matcher, get_name_matcher
 from maya_mock.base.constants import (
     SHAPE_CLASS,
     DEFAULT_PREFIX_BY_SHAPE_TYPE,
@@ -18,7 +25,6 @@ from maya_mock.base.constants import (
     IMPOSSIBLE_CONNECTIONS,
 )
 from maya_mock.base.naming import (
-    pattern_to_regex,
     conform_node_name,
     is_valid_node_name,
 )
@@ -29,15 +35,37 @@ from maya_mock.base.signal import Signal
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of resolved plugs to remember.
+_PLUG_CACHE_SIZE = 4096
+
+
+def _is_scanning_dagpath(pattern):
+    """
+    Determine if resolving a dagpath pattern need to enumerate every node name in the scene.
+    This is the case for partial dagpaths which first segment contain a wildcard.
+
+    :param str pattern: A node name, a partial dagpath or an absolute dagpath.
+    :rtype: bool
+    """
+    matcher = get_dagpath_matcher(pattern)
+    return not matcher.absolute and matcher.segments[0].literal is None
+
 
 class MockedSession(
-    collections.MutableMapping
-):  # pylint: disable=too-many-public-methods
+    StatsMixin, LazyPortsMixin, collections.MutableMapping
+):  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """
     Collection of nodes, ports and connections.
 
     :param schema: The schema to use for the session. Optional
     :type schema: maya_mock.MockedSessionSchema or None
+    :param bool lazy_ports: If True, the ports defined by the schema are only created
+        when they are first looked up, enumerated or connected.
+        Queries return the same results, however `ports` and `ports_by_node`
+        only contain the ports that were created so far.
+    :param bool columnar: If True, the nodes type is also stored in a column
+        indexed by integer ids which make filtered scans faster on large scenes.
+        See `iter_nodes_by_type`.
     """
 
     onNodeAdded = Signal(MockedNode)
@@ -47,7 +75,7 @@ class MockedSession(
     onConnectionAdded = Signal(MockedConnection)
     onConnectionRemoved = Signal(MockedConnection)
 
-    def __init__(self, schema=None):
+    def __init__(self, schema=None, lazy_ports=False, columnar=False):
         super(MockedSession, self).__init__()
         self.nodes = set()
         self.namespaces = set()
@@ -56,6 +84,49 @@ class MockedSession(
         self.selection = set()
         self.ports_by_node = collections.defaultdict(set)
         self.schema = schema
+        self.lazy_ports = lazy_ports
+
+        # Nodes which schema ports are not all created yet, see `lazy_ports`.
+        # Values are the names of the schema ports that were created or removed.
+        self._lazy_nodes = {}
+        self._lazy_nodes_by_type = collections.defaultdict(set)
+
+        # Schema ports definitions and aliases by node type.
+        self._schema_ports = {}
+
+        # Bitwise or of the ports flags by node.
+        # Used to skip nodes that cannot have a port with specific flags.
+        self._port_flags = {}
+
+        # Shared instances of the nodes, ports and types names.
+        self._names = InternTable()
+
+        # Columns of nodes attributes by node id, see `columnar`.
+        self._columns = NodeColumns() if columnar else None
+
+        # Index of nodes by their name and their position in the hierarchy.
+        self._index = DagIndex()
+
+        # Allocator for automatic node names. ex: transform1, transform2, etc.
+        self._name_allocator = NameAllocator(self._index.has_child)
+
+        # Index of ports by their node and names.
+        self._port_index = PortIndex()
+
+        # Index of connections by their ports.
+        self._connection_index = ConnectionIndex()
+
+        # Cache of ports by the pattern they were resolved from.
+        # This is invalidated everytime a dagpath change.
+        self._plug_cache = {}
+
+        # Statistics about the nodes dagpath cache.
+        # Keys are 'misses' and 'invalidations', hits are counted separately.
+        self.dagpath_cache_stats = collections.Counter()
+        self.dagpath_cache_hits = 0
+
+        # Statistics about the query methods, see `stats`.
+        self._query_stats = QueryStats()
 
         if schema:
             if not isinstance(schema, MockedSessionSchema):
@@ -101,7 +172,7 @@ class MockedSession(
         :return: True if the dagpath match an existing object. False otherwise.
         :rtype: bool
         """
-        return bool(self.get_node_by_match(dagpath, strict=False))
+        return next(self.iter_node_by_match(dagpath), None) is not None
 
     def _unique_name(self, prefix, parent=None):
         """
@@ -111,13 +182,38 @@ class MockedSession(
         :param MockedNode parent:
         :return:
         """
-        counter = itertools.count(1)
-        while True:
-            name = "{}{}".format(prefix, next(counter))
-            dagpath = naming.join(parent.dagpath, name) if parent else "|" + name
-            if is_valid_node_name(name) and not self.node_exist(dagpath):
-                return name
+        return self._name_allocator.allocate(prefix, parent=parent)
+
+    def reserve_unique_names(self, prefix, count, parent=None):
+        """
+        Reserve multiple unique names at once.
+        Useful when creating a lot of nodes with the same prefix.
+        The names won't be used for automatic naming until a node using them is removed.
+
+        :param str prefix: The names prefix. ex: 'transform'
+        :param int count: The number of names to reserve.
+        :param parent: The parent of the future nodes. None for root nodes.
+        :type parent: MockedNode or None
+        :return: A list of unique names. ex: ['transform1', 'transform2']
+        :rtype: list[str]
+        """
+        return self._name_allocator.reserve(prefix, count, parent=parent)
+
+    @track_query
+    def iter_nodes_by_type(self, node_type):
+        """
+        Yield all the nodes of a specific type.
 
+        :param str node_type: A node type. ex: 'transform'
+        :return: A node generator
+        :rtype: Generator[MockedNode]
+        """
+        if self._columns is not None:
+            return iter(tuple(self._columns.iter_nodes(node_type=node_type)))
+        self._query_stats.scan("iter_nodes_by_type")
+        return iter(tuple(node for node in self.nodes if node.type == node_type))
+
+    @track_query
     def get_node_by_name(self, name):
         """
         Retrieve a node by it's name.
@@ -127,10 +223,7 @@ class MockedSession(
         :return: A node or None if no match was found.
         :rtype: MockedNode or None
         """
-        for node in self.nodes:
-            if node.name == name:
-                return node
-        return None
+        return next(iter(self._index.get_by_name(name)), None)
 
     def get_nodes_by_match(self, pattern, strict=True):
         """
@@ -168,6 +261,7 @@ class MockedSession(
         """
         return next(iter(self.get_nodes_by_match(pattern, **kwargs)), None)
 
+    @track_query
     def iter_node_by_match(self, pattern):
         """
         Yield all the node which dagpath match the provided pattern.
@@ -176,12 +270,16 @@ class MockedSession(
         :return: A node generator
         :rtype: Generator[MockedNode]
         """
-        regex = pattern_to_regex(pattern)
+        # No pattern always match
+        if pattern is None:
+            self._query_stats.scan("iter_node_by_match")
+            return iter(tuple(self.nodes))
 
-        for node in self.nodes:
-            if re.match(regex, node.dagpath):
-                yield node
+        if _is_scanning_dagpath(pattern):
+            self._query_stats.scan("iter_node_by_match")
+        return self._index.iter_match(pattern)
 
+    @track_query
     def get_port_by_match(self, pattern):
         """
         Retrieve a port by matching it against a provided pattern.
@@ -191,11 +289,76 @@ class MockedSession(
         :return: A port or None if no match was found.
         :rtype: MockedPort or None
         """
-        for port in self.ports:
-            if port.match(pattern):
-                return port
-        return None
+        # No pattern always match
+        if pattern is None:
+            self._query_stats.scan("get_port_by_match")
+            self._materialize_all_ports()
+            return next(iter(self.ports), None)
 
+        port = self._plug_cache.get(pattern)
+        if port is not None:
+            return port
+
+        port = next(self.iter_port_by_match(pattern), None)
+        if port is not None:
+            if len(self._plug_cache) >= _PLUG_CACHE_SIZE:
+                self._plug_cache.clear()
+            self._plug_cache[pattern] = port
+        return port
+
+    @track_query
+    def iter_port_by_match(self, pattern):
+        """
+        Yield all the ports matching the provided pattern.
+
+        - `node.attr`: The node part is resolved like any node pattern,
+           then the attribute part is resolved on the matching nodes only.
+        - `attr`: Match the attribute on any node.
+
+        :param str pattern: The pattern to match.
+        :return: A port generator
+        :rtype: Generator[MockedPort]
+        """
+        node_pattern, sep, port_pattern = pattern.partition(".")
+        if not sep:
+            if get_name_matcher(pattern).literal is None:
+                self._query_stats.scan("iter_port_by_match")
+            for port in self._iter_port_by_name_any_node(pattern):
+                yield port
+            return
+
+        for node in self.iter_node_by_match(node_pattern):
+            self._materialize_ports_by_pattern(node, port_pattern)
+            for port in self._port_index.iter_match(node, port_pattern):
+                yield port
+
+    def _iter_port_by_name_any_node(self, pattern):
+        """
+        Yield the ports of any node which long or short name match a pattern.
+
+        :param str pattern: A port name pattern. ex: 'translate*'
+        :return: A port generator
+        :rtype: Generator[MockedPort]
+        """
+        known = set()
+        for port in self._port_index.iter_match_any_node(pattern):
+            known.add(port)
+            yield port
+
+        # Create any matching port that don't exist yet.
+        matcher = get_name_matcher(pattern)
+        for node_type, nodes in tuple(self._lazy_nodes_by_type.items()):
+            _, aliases, _ = self._get_schema_ports(node_type)
+            if not any(matcher.match(alias) for alias in aliases):
+                continue
+            for node in tuple(nodes):
+                self._materialize_ports_by_pattern(node, pattern)
+                for port in self._port_index.iter_match(node, pattern):
+                    if port not in known:
+                        known.add(port)
+                        yield port
+
+    @track_query
     def get_connection_by_ports(self, src, dst):
         """
         Get an existing connection from two ports
@@ -205,10 +368,7 @@ class MockedSession(
         :return: An existing connection. None otherwise.
         :rtype: MockedConnection or None
         """
-        return next(
-            (conn for conn in self.connections if conn.src is src and conn.dst is dst),
-            None,
-        )
+        return self._connection_index.get(src, dst)
 
     @staticmethod
     def warning(msg):
@@ -264,8 +424,7 @@ class MockedSession(
         else:
             # Next, if the name is invalid or clash with another node dagpath,
             # we'll need to add a number suffix.
-            dagpath = "%s|%s" % (parent.dagpath, name) if parent else "|" + name
-            if not is_valid_node_name(name) or self.node_exist(dagpath):
+            if not is_valid_node_name(name) or self._has_child(parent, name):
                 name = name.rstrip(string.digits)
                 name = self._unique_name(name, parent=parent)
 
@@ -277,36 +436,160 @@ class MockedSession(
             transform_name = self._unique_name(transform_name_prefix)
             parent = self.create_node("transform", name=transform_name)
 
+        return self._add_node(node_type, name, parent, emit)
+
+    def _has_child(self, parent, name):
+        """
+        Determine if a node have a child with a specific name.
+
+        :param parent: A parent node. None for root nodes.
+        :type parent: MockedNode or None
+        :param str name: A node name.
+        :return: True if a child exist with this name. False otherwise.
+        :rtype: bool
+        """
+        return self._index.has_child(parent, name)
+
+    def _add_node(self, node_type, name, parent, emit):
+        """
+        Create a node which name was already resolved by `create_node`.
+
+        :param str node_type: The type of the node.
+        :param str name: The unique name of the node.
+        :param parent: The parent of the node if applicable.
+        :type parent: MockedNode or None
+        :param bool emit: If True, the `onPortAdded` signal will be emitted.
+        :return: The created node
+        :rtype: MockedNode
+        """
         node = MockedNode(self, node_type, name, parent=parent)
         if emit:
             signal = self.onNodeAdded
             LOG.debug("%s emitted with %s", signal, node)
             signal.emit(node)
         self.nodes.add(node)
+        self._index.add(node)
+        self._name_allocator.add(node)
+        if self._columns is not None:
+            self._columns.add(node)
+        self._invalidate_melobjects((node.name,))
 
         # Add port from configuration if needed
         if self.schema:
             node_def = self.schema.get(node_type)
-            if node_def:
-                node_def.apply(self, node)
+            if node_def and self.lazy_ports:
+                self._lazy_nodes[node] = set()
+                self._lazy_nodes_by_type[node_type].add(node)
+            elif node_def:
+                definitions, _, _ = self._get_schema_ports(node_type)
+                for port_name, definition in definitions.items():
+                    self.create_port(node, port_name, definition=definition)
 
         return node
 
     def remove_node(self, node, emit=True):
         """
         Remove a node from the graph.
+        Like in Maya, the node children are also removed.
+
         :param node:
         :param bool emit: If True, the `onPortAdded` signal will be emitted.
         """
+        for child in tuple(node.children):
+            self.remove_node(child, emit=emit)
+
         # Remove any port that where used by the node.
-        ports = [port for port in self.ports if port.node is node]
+        ports = tuple(self.ports_by_node.get(node, ()))
         for port in ports:
             self.remove_port(port, emit=emit)
+        self.ports_by_node.pop(node, None)
+        self._port_index.remove_node(node)
+        self._port_flags.pop(node, None)
+        self._forget_lazy_node(node)
 
         if emit:
             self.onNodeRemoved.emit(node)
 
         self.nodes.remove(node)
+        self._index.remove(node)
+        self._name_allocator.remove(node)
+        if self._columns is not None:
+            self._columns.remove(node)
+        self._invalidate_melobjects((node.name,))
+        node._melobject = None  # pylint: disable=protected-access
+        self.release_name(node.name)
+        self.release_name(node.type)
+        self._plug_cache.clear()
+        if node.parent:
+            node.parent.children.discard(node)
+
+    def intern_name(self, name):
+        """
+        Get the shared instance of a node, port or type name.
+        Names are interned so repeated names don't cost memory
+        and comparing them can short-circuit on identity.
+
+        :param name: A name
+        :type name: str or None
+        :return: A string equal to the provided name
+        :rtype: str or None
+        """
+        return self._names(name)
+
+    def release_name(self, name):
+        """
+        Release a name returned by `intern_name`.
+        Names are forgotten once they are no longer used by any node or port.
+
+        :param name: A name
+        :type name: str or None
+        """
+        self._names.release(name)
+
+    def _invalidate_melobjects(self, names):
+        """
+        Invalidate the cached MEL representation of all the nodes with specific names.
+        The MEL representation of a node only depend on the nodes that share it's name.
+
+        :param names: The names of the nodes to invalidate.
+        :type names: Iterable[str]
+        """
+        for name in names:
+            for node in self._index.get_by_name(name):
+                node._melobject = None  # pylint: disable=protected-access
+
+    def _on_node_renamed(self, node, old_name):
+        """
+        Called by a node when it's name change.
+
+        :param MockedNode node: The renamed node.
+        :param str old_name: The previous name of the node.
+        """
+        if node in self.nodes:
+            node._name = self.intern_name(node.name)  # pylint: disable=protected-access
+            self.release_name(old_name)
+            self._index.rename(node, old_name)
+            self._name_allocator.rename(node, old_name)
+            self._plug_cache.clear()
+
+            # The children MEL representation can include the node name.
+            names = {child.name for child in node.iter_hierarchy()}
+            names.add(old_name)
+            self._invalidate_melobjects(names)
+
+    def _on_node_reparented(self, node, old_parent):
+        """
+        Called by a node when it's parent change.
+
+        :param MockedNode node: The re-parented node.
+        :param old_parent: The previous parent of the node.
+        :type old_parent: MockedNode or None
+        """
+        if node in self.nodes:
+            self._index.reparent(node, old_parent)
+            self._name_allocator.reparent(node, old_parent)
+            self._plug_cache.clear()
+            self._invalidate_melobjects({child.name for child in node.iter_hierarchy()})
 
     def create_port(self, node, name, emit=True, **kwargs):
         """
@@ -318,8 +601,12 @@ class MockedSession(
         :rtype: MockedPort
         """
         port = MockedPort(node, name, **kwargs)
+        if not self._is_schema_definition(port):
+            port.definition = port.definition.intern(self._names)
         self.ports_by_node[node].add(port)
         self.ports.add(port)
+        self._port_index.add(port)
+        self._port_flags[node] = self._port_flags.get(node, 0) | port.flags
         if emit:
             self.onPortAdded.emit(port)
         return port
@@ -332,9 +619,9 @@ class MockedSession(
         :return:
         """
         # Remove any connection that used the port
-        connections = [
-            conn for conn in self.connections if conn.src is port or conn.dst is port
-        ]
+        index = self._connection_index
+        # A port connected to itself is both in it's inputs and outputs.
+        connections = set(index.get_inputs(port)) | set(index.get_outputs(port))
         for conn in connections:
             self.remove_connection(conn, emit=emit)
 
@@ -342,6 +629,23 @@ class MockedSession(
             self.onPortRemoved.emit(port)
 
         self.ports.remove(port)
+        self._plug_cache.clear()
+        if not self._is_schema_definition(port):
+            port.definition.release(self._names)
+
+        # Ensure a removed schema port is not created again.
+        handled = self._lazy_nodes.get(port.node)
+        if handled is not None and not port.user_defined:
+            handled.add(port.name)
+        siblings = self.ports_by_node.get(port.node)
+        if siblings is not None:
+            siblings.discard(port)
+        self._port_index.remove(port, siblings or ())
+
+        flags = 0
+        for sibling in siblings or ():
+            flags |= sibling.flags
+        self._port_flags[port.node] = flags
 
     def remove_node_port(self, node, name, emit=True):
         """
@@ -389,12 +693,25 @@ class MockedSession(
             self.create_connection(port_output, dst)
             return None
 
-        connection = MockedConnection(src, dst)
-        self.connections.add(connection)
+        connection = self._add_connection(src, dst)
         if emit:
             self.onConnectionAdded.emit(connection)
         return connection
 
+    def _add_connection(self, src, dst):
+        """
+        Create a connection which ports were already validated by `create_connection`.
+
+        :param MockedPort src: The connection source port.
+        :param MockedPort dst: The connection destination port.
+        :return: The created connection
+        :rtype: MockedConnection
+        """
+        connection = MockedConnection(src, dst)
+        self.connections.add(connection)
+        self._connection_index.add(connection)
+        return connection
+
     def remove_connection(self, connection, emit=True):
         """
         Remove an existing connection from the scene.
@@ -406,9 +723,45 @@ class MockedSession(
         if emit:
             self.onConnectionRemoved.emit(connection)
         self.connections.remove(connection)
+        self._connection_index.remove(connection)
 
     # Port methods
 
+    @track_query
+    def get_node_ports(self, node):
+        """
+        Retrieve all the ports of a node.
+
+        :param MockedNode node: The node to inspect.
+        :return: A set of ports
+        :rtype: set[MockedPort]
+        """
+        self._materialize_node_ports(node)
+        return self.ports_by_node.get(node, set())
+
+    @track_query
+    def get_node_ports_by_flags(self, node, flags):
+        """
+        Retrieve the ports of a node that have all the provided flags.
+
+        :param MockedNode node: The node to inspect.
+        :param int flags: A combination of the `PORT_*` constants.
+        :return: A list of ports
+        :rtype: list[MockedPort]
+        """
+        node_flags = self._port_flags.get(node, 0)
+        if node in self._lazy_nodes:
+            node_flags |= self._get_schema_ports(node.type)[2]
+
+        # Skip the node if none of it's ports can match
+        if node_flags & flags != flags:
+            return []
+
+        return [
+            port for port in self.get_node_ports(node) if port.flags & flags == flags
+        ]
+
+    @track_query
     def get_node_port_by_name(self, node, name):
         """
         Retrive a port from a node and a port name.
@@ -421,14 +774,11 @@ class MockedSession(
         assert isinstance(node, MockedNode)
         assert isinstance(name, six.string_types)
 
-        for port in self.ports_by_node.get(node, ()):
-            if port.name == name:
-                return port
-            if port.short_name == name:
-                return port
-            if port.nice_name == name:
-                return port
-        return None
+        if node in self._lazy_nodes:
+            _, aliases, _ = self._get_schema_ports(node.type)
+            self._materialize_ports(node, aliases.get(name, ()))
+
+        return self._port_index.get(node, name)
 
     def port_is_source(self, port):
         """
@@ -437,7 +787,7 @@ class MockedSession(
         :return: True if the port is the source of a connection. False otherwise.
         :rtype: bool
         """
-        return any(connection.src is port for connection in self.connections)
+        return bool(self._connection_index.get_outputs(port))
 
     def port_is_destination(self, port):
         """
@@ -446,7 +796,7 @@ class MockedSession(
         :return: True if the port is the destination of a connection. False otherwise.
         :rtype: bool
         """
-        return any(connection.dst is port for connection in self.connections)
+        return bool(self._connection_index.get_inputs(port))
 
     def get_port_input_connections(self, port):
         """
@@ -455,7 +805,7 @@ class MockedSession(
         :return: A set of mocked connections
         :rtype: Set[MockedConnection]
         """
-        return {connection for connection in self.connections if connection.dst is port}
+        return set(self._connection_index.get_inputs(port))
 
     def get_port_output_connections(self, port):
         """
@@ -464,7 +814,7 @@ class MockedSession(
         :return: A set of mocked connections
         :rtype: Set[MockedConnection]
         """
-        return {connection for connection in self.connections if connection.src is port}
+        return set(self._connection_index.get_outputs(port))
 
     def get_port_inputs(self, port):
         """
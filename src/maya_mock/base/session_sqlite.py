@@ -0,0 +1,903 @@
+"""
+Session which store it's nodes, ports and connections in a SQLite database.
+
+Only the objects in use are kept in memory which allow working with scenes
+that would not fit in memory as an object graph.
+"""
+import collections
+import logging
+import sqlite3
+import weakref
+
+import six
+from six.moves import cPickle as pickle
+
+from maya_mock.base._index import _split_numeric_suffix
+from maya_mock.base._utils import InternTable, QueryStats, track_query
+from maya_mock.base.connection import MockedConnection
+from maya_mock.base.constants import EnumAttrTypes
+from maya_mock.base.matcher import get_dagpath_matcher, get_name_matcher
+from maya_mock.base.node import MockedNode
+from maya_mock.base.port import AttributeDef, MockedPort
+from maya_mock.base.schema import MockedSessionSchema
+from maya_mock.base.session import MockedSession, _is_scanning_dagpath
+
+LOG = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE nodes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    parent INTEGER
+);
+CREATE INDEX nodes_by_name ON nodes (name);
+CREATE INDEX nodes_by_parent ON nodes (parent, name);
+CREATE INDEX nodes_by_type ON nodes (type);
+
+CREATE TABLE ports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    node INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    short_name TEXT NOT NULL,
+    nice_name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    flags INTEGER NOT NULL,
+    parent TEXT,
+    value BLOB
+);
+CREATE INDEX ports_by_node ON ports (node, name);
+CREATE INDEX ports_by_name ON ports (name);
+CREATE INDEX ports_by_short_name ON ports (short_name);
+
+CREATE TABLE connections (
+    src INTEGER NOT NULL,
+    dst INTEGER NOT NULL,
+    PRIMARY KEY (src, dst)
+);
+CREATE INDEX connections_by_dst ON connections (dst);
+"""
+
+_NODE_COLUMNS = "id, name, type, parent"
+_PORT_COLUMNS = "id, node, name, short_name, nice_name, type, flags, parent"
+
+
+def _dump_value(value):
+    return sqlite3.Binary(pickle.dumps(value, 2))
+
+
+def _load_value(data):
+    return pickle.loads(bytes(data))
+
+
+class SqliteNode(MockedNode):
+    """
+    A node stored in a `MockedSqliteSession`.
+    """
+
+    __slots__ = ("rowid",)
+
+    def __init__(
+        self, session, rowid, name, node_type, parent
+    ):  # pylint: disable=super-init-not-called,too-many-arguments
+        """
+        Create a node from it's database row.
+        `MockedNode.__init__` is not called since the node already exist in the database.
+
+        :param MockedSqliteSession session: The session that own the node.
+        :param int rowid: The node row id.
+        :param str name: The node name
+        :param str node_type: The node type
+        :param parent: The node parent if any.
+        :type parent: SqliteNode or None
+        """
+        self._session = session
+        self._name = name
+        self.type = node_type
+        self._parent = parent
+        self._dagpath = None
+        self._melobject = None
+        self.rowid = rowid
+
+    @property
+    def children(self):
+        """
+        :return: The node children
+        :rtype: set[SqliteNode]
+        """
+        return self._session._get_children(self)  # pylint: disable=protected-access
+
+
+class SqlitePort(MockedPort):
+    """
+    A port stored in a `MockedSqliteSession`.
+    The port value is read from and written to the database.
+    """
+
+    __slots__ = ("rowid",)
+
+    def __init__(
+        self, node, definition, rowid
+    ):  # pylint: disable=super-init-not-called
+        """
+        Create a port from it's database row.
+        `MockedPort.__init__` is not called since the value is stored in the database.
+
+        :param SqliteNode node: The port node.
+        :param AttributeDef definition: The port definition.
+        :param int rowid: The port row id.
+        """
+        self.node = node
+        self.definition = definition
+        self.rowid = rowid
+
+    @property
+    def value(self):
+        """
+        :return: The port value
+        :rtype: object
+        """
+        return self.node._session._get_port_value(  # pylint: disable=protected-access
+            self
+        )
+
+    @value.setter
+    def value(self, value):
+        self.node._session._set_port_value(  # pylint: disable=protected-access
+            self, value
+        )
+
+
+class SqliteConnection(MockedConnection):
+    """
+    A connection between two ports of a `MockedSqliteSession`.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+class _ObjectCache(object):
+    """
+    Objects loaded from the database by their row id.
+    Connections are identified by the row ids of their source and destination ports.
+
+    The most recently used objects are kept in memory.
+    Older objects are kept as long as they are referenced elsewhere
+    so the same row is never loaded twice at the same time.
+    """
+
+    def __init__(self, maxsize):
+        self._objects = weakref.WeakValueDictionary()
+        self._recent = collections.OrderedDict()
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, rowid):
+        """
+        :param int rowid: A row id
+        :return: The object loaded from this row. None if the row is not loaded.
+        """
+        obj = self._objects.get(rowid)
+        if obj is not None:
+            self._touch(rowid, obj)
+        return obj
+
+    def peek(self, rowid):
+        """
+        Same as `get` without marking the object as recently used.
+
+        :param int rowid: A row id
+        :return: The object loaded from this row. None if the row is not loaded.
+        """
+        return self._objects.get(rowid)
+
+    def add(self, rowid, obj):
+        """
+        :param int rowid: A row id
+        :param object obj: The object loaded from this row.
+        """
+        self._objects[rowid] = obj
+        self._touch(rowid, obj)
+
+    def discard(self, rowid):
+        """
+        :param int rowid: The row id of an object to forget.
+        """
+        self._objects.pop(rowid, None)
+        self._recent.pop(rowid, None)
+
+    def _touch(self, rowid, obj):
+        recent = self._recent
+        recent.pop(rowid, None)
+        recent[rowid] = obj
+        if len(recent) > self.maxsize:
+            recent.popitem(last=False)
+
+
+class _NodeMapping(collections.Mapping):
+    """
+    Read-only mapping of every node of a `MockedSqliteSession` to a value read from the database.
+    Replace the dicts indexed by node of `MockedSession`.
+
+    :param MockedSqliteSession session: The session that own the nodes.
+    :param callable getter: Return the value of a node.
+    """
+
+    def __init__(self, session, getter):
+        self._session = session
+        self._getter = getter
+
+    def __getitem__(self, node):
+        if not isinstance(node, SqliteNode) or node.rowid is None:
+            raise KeyError(node)
+        return self._getter(node)
+
+    def __iter__(self):
+        return iter(self._session)
+
+    def __len__(self):
+        return len(self._session)
+
+
+class MockedSqliteSession(
+    MockedSession
+):  # pylint: disable=too-many-public-methods,too-many-instance-attributes
+    """
+    Session which store it's nodes, ports and connections in a SQLite database.
+
+    Nodes and ports are loaded from the database when they are queried.
+    The most recently used ones are kept in memory, the others are only kept
+    as long as they are referenced elsewhere.
+
+    Note that `nodes`, `ports`, `connections` and `ports_by_node` load every object of the scene.
+
+    :param schema: The schema to use for the session. Optional
+    :type schema: maya_mock.MockedSessionSchema or None
+    :param bool lazy_ports: Not supported, schema ports are always stored in the database.
+    :param bool columnar: Not supported, the database already index nodes by type and parent.
+    :param str path: The path to the database file.
+        By default, a temporary file is used and deleted when the session is closed.
+    :param int cache_size: The number of nodes, ports and connections to keep in memory.
+    """
+
+    def __init__(
+        self, schema=None, lazy_ports=False, columnar=False, path="", cache_size=4096
+    ):  # pylint: disable=super-init-not-called,too-many-arguments
+        if lazy_ports:
+            raise ValueError("lazy_ports is not supported by %s" % type(self).__name__)
+        if columnar:
+            raise ValueError("columnar is not supported by %s" % type(self).__name__)
+
+        # The in-memory containers of MockedSession are replaced by the database.
+        # Every MockedSession method that use them is overridden.
+        self.namespaces = set()
+        self.selection = set()
+        self.schema = schema
+        self.lazy_ports = False
+        self.dagpath_cache_stats = collections.Counter()
+        self.dagpath_cache_hits = 0
+        self._query_stats = QueryStats()
+
+        self._lazy_nodes = {}
+        self._lazy_nodes_by_type = {}
+        self._schema_ports = {}
+        self._names = InternTable()
+        self._plug_cache = {}
+
+        # Names returned by `reserve_unique_names` by parent row id.
+        self._reserved_names = collections.defaultdict(set)
+
+        # The next suffix that might be free for automatic names by parent row id and prefix.
+        # Every smaller suffix is in use so bulk creation never count from 1.
+        self._next_suffix = {}
+
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._nodes_cache = _ObjectCache(cache_size)
+        self._ports_cache = _ObjectCache(cache_size)
+        self._connections_cache = _ObjectCache(cache_size)
+
+        if schema:
+            if not isinstance(schema, MockedSessionSchema):
+                raise ValueError("Unexpected schema type for %s" % schema)
+            for name, type_ in schema.default_state.items():
+                self.create_node(type_, name)
+
+    def __str__(self):
+        return "<MockedSqliteSession %s nodes>" % len(self)
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError
+
+    def __delitem__(self, key):
+        raise NotImplementedError
+
+    def __iter__(self):
+        return self._iter_nodes("SELECT %s FROM nodes" % _NODE_COLUMNS)
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def close(self):
+        """
+        Close the database. The session cannot be used afterward.
+        """
+        self._db.close()
+
+    @property
+    def nodes(self):
+        """
+        :return: All the nodes in the scene.
+        :rtype: set[SqliteNode]
+        """
+        return set(self)
+
+    @property
+    def ports(self):
+        """
+        :return: All the ports in the scene.
+        :rtype: set[SqlitePort]
+        """
+        return set(self._iter_ports("SELECT %s FROM ports" % _PORT_COLUMNS))
+
+    @property
+    def connections(self):
+        """
+        :return: All the connections in the scene.
+        :rtype: set[SqliteConnection]
+        """
+        rows = self._db.execute("SELECT src, dst FROM connections").fetchall()
+        return {
+            self._get_connection(self._get_port(src), self._get_port(dst))
+            for src, dst in rows
+        }
+
+    @property
+    def ports_by_node(self):
+        """
+        :return: The ports of every node in the scene.
+        :rtype: Mapping[SqliteNode, set[SqlitePort]]
+        """
+        return _NodeMapping(self, self._get_node_ports)
+
+    @property
+    def _port_flags(self):
+        """
+        :return: The bitwise or of the ports flags of every node in the scene.
+        :rtype: Mapping[SqliteNode, int]
+        """
+        return _NodeMapping(self, self._get_port_flags)
+
+    def _get_container_stats(self):
+        result = {
+            name: self._db.execute("SELECT COUNT(*) FROM %s" % name).fetchone()[0]
+            for name in ("nodes", "ports", "connections")
+        }
+        # Every node is in `ports_by_node`, nodes without ports are the stale entries.
+        result["ports_by_node"] = result["nodes"]
+        result["ports_by_node_stale"] = self._db.execute(
+            "SELECT COUNT(*) FROM nodes WHERE id NOT IN (SELECT node FROM ports)"
+        ).fetchone()[0]
+        return result
+
+    # --- Loading
+
+    def _get_node(self, rowid):
+        """
+        :param int rowid: A node row id
+        :return: The node stored in this row.
+        :rtype: SqliteNode
+        """
+        node = self._nodes_cache.get(rowid)
+        if node is None:
+            row = self._db.execute(
+                "SELECT %s FROM nodes WHERE id = ?" % _NODE_COLUMNS, (rowid,)
+            ).fetchone()
+            node = self._load_node(*row)
+        return node
+
+    def _load_node(self, rowid, name, node_type, parent_id):
+        parent = None if parent_id is None else self._get_node(parent_id)
+        # Names are interned when they are written to the database.
+        names = self._names
+        node = SqliteNode(self, rowid, names.get(name), names.get(node_type), parent)
+        self._nodes_cache.add(rowid, node)
+        return node
+
+    def _iter_nodes(self, query, params=(), segment=None):
+        """
+        Yield the nodes returned by a query.
+
+        :param str query: A query that select the node columns.
+        :param tuple params: The query parameters.
+        :param segment: If provided, only yield nodes which name match this pattern segment.
+        :type segment: LiteralMatcher or RegexMatcher or None
+        :return: A node generator
+        :rtype: Generator[SqliteNode]
+        """
+        for row in self._db.execute(query, params).fetchall():
+            if segment is not None and not segment.match(row[1]):
+                continue
+            node = self._nodes_cache.get(row[0])
+            yield self._load_node(*row) if node is None else node
+
+    def _get_port(self, rowid):
+        """
+        :param int rowid: A port row id
+        :return: The port stored in this row.
+        :rtype: SqlitePort
+        """
+        port = self._ports_cache.get(rowid)
+        if port is None:
+            row = self._db.execute(
+                "SELECT %s FROM ports WHERE id = ?" % _PORT_COLUMNS, (rowid,)
+            ).fetchone()
+            port = self._load_port(*row)
+        return port
+
+    def _load_port(
+        self, rowid, node_id, name, short_name, nice_name, port_type, flags, parent
+    ):  # pylint: disable=too-many-arguments
+        node = self._get_node(node_id)
+        definition = AttributeDef(
+            name, short_name, nice_name, EnumAttrTypes[port_type], flags, parent
+        )
+
+        # Names are interned when they are written to the database.
+        definition = self._share_definition(node, definition, self._names.get)
+        port = SqlitePort(node, definition, rowid)
+        self._ports_cache.add(rowid, port)
+        return port
+
+    def _get_connection(self, src, dst):
+        """
+        :param SqlitePort src: The source port of an existing connection.
+        :param SqlitePort dst: The destination port of an existing connection.
+        :return: The connection between the two ports.
+        :rtype: SqliteConnection
+        """
+        key = (src.rowid, dst.rowid)
+        connection = self._connections_cache.get(key)
+        if connection is None:
+            connection = SqliteConnection(src, dst)
+            self._connections_cache.add(key, connection)
+        return connection
+
+    def _share_definition(self, node, definition, table):
+        """
+        Share a port definition with the other ports of the same type if possible.
+
+        :param SqliteNode node: The port node.
+        :param AttributeDef definition: A port definition.
+        :param callable table: Used to intern the definition when it's not a schema one.
+        :return: An equal port definition
+        :rtype: AttributeDef
+        """
+        shared = None
+        if self.schema and self.schema.get(node.type):
+            definitions, _, _ = self._get_schema_ports(node.type)
+            shared = definitions.get(definition.name)
+        if shared == definition:
+            return shared
+        return definition.intern(table)
+
+    def _iter_ports(self, query, params=(), matcher=None):
+        """
+        Yield the ports returned by a query.
+
+        :param str query: A query that select the port columns.
+        :param tuple params: The query parameters.
+        :param matcher: If provided, only yield ports which long or short name match it.
+        :type matcher: LiteralMatcher or RegexMatcher or None
+        :return: A port generator
+        :rtype: Generator[SqlitePort]
+        """
+        for row in self._db.execute(query, params).fetchall():
+            if (
+                matcher is not None
+                and not matcher.match(row[2])
+                and not matcher.match(row[3])
+            ):
+                continue
+            port = self._ports_cache.get(row[0])
+            yield self._load_port(*row) if port is None else port
+
+    def _get_port_value(self, port):
+        row = self._db.execute(
+            "SELECT value FROM ports WHERE id = ?", (port.rowid,)
+        ).fetchone()
+        return None if row is None else _load_value(row[0])
+
+    def _set_port_value(self, port, value):
+        self._db.execute(
+            "UPDATE ports SET value = ? WHERE id = ?", (_dump_value(value), port.rowid)
+        )
+
+    # --- Nodes
+
+    @track_query
+    def iter_nodes_by_type(self, node_type):
+        return iter(
+            tuple(
+                self._iter_nodes(
+                    "SELECT %s FROM nodes WHERE type = ?" % _NODE_COLUMNS, (node_type,)
+                )
+            )
+        )
+
+    @track_query
+    def get_node_by_name(self, name):
+        query = "SELECT %s FROM nodes WHERE name = ? LIMIT 1" % _NODE_COLUMNS
+        return next(self._iter_nodes(query, (name,)), None)
+
+    @track_query
+    def iter_node_by_match(self, pattern):
+        # No pattern always match
+        if pattern is None:
+            self._query_stats.scan("iter_node_by_match")
+            return iter(tuple(self))
+
+        if _is_scanning_dagpath(pattern):
+            self._query_stats.scan("iter_node_by_match")
+        matcher = get_dagpath_matcher(pattern)
+        segments = matcher.segments
+
+        # An absolute dagpath start from the root of the scene.
+        # A partial dagpath can start anywhere in the hierarchy.
+        if matcher.absolute:
+            frontier = self._iter_children(None, segments[0])
+        else:
+            frontier = self._iter_named(segments[0])
+
+        for index, segment in enumerate(segments[1:]):
+            frontier = [
+                child
+                for parent in tuple(frontier)
+                for child in self._iter_children(parent, segment)
+            ]
+            # ex: '*|b' also match the root node '|b'
+            if index == 0 and matcher.optional_root:
+                frontier.extend(self._iter_children(None, segment))
+
+        return iter(tuple(frontier))
+
+    def _iter_named(self, segment):
+        """
+        Yield nodes anywhere in the hierarchy which name match a pattern segment.
+
+        :param segment: A compiled pattern segment
+        :type segment: LiteralMatcher or RegexMatcher
+        """
+        if segment.literal is not None:
+            query = "SELECT %s FROM nodes WHERE name = ?" % _NODE_COLUMNS
+            return self._iter_nodes(query, (segment.literal,))
+        query = "SELECT %s FROM nodes" % _NODE_COLUMNS
+        return self._iter_nodes(query, segment=segment)
+
+    def _iter_children(self, parent, segment):
+        """
+        Yield children of a node which name match a pattern segment.
+
+        :param parent: A parent node. None for root nodes.
+        :type parent: SqliteNode or None
+        :param segment: A compiled pattern segment
+        :type segment: LiteralMatcher or RegexMatcher
+        """
+        parent_id = parent.rowid if parent else None
+        if segment.literal is not None:
+            query = "SELECT %s FROM nodes WHERE parent IS ? AND name = ?"
+            return self._iter_nodes(query % _NODE_COLUMNS, (parent_id, segment.literal))
+        query = "SELECT %s FROM nodes WHERE parent IS ?" % _NODE_COLUMNS
+        return self._iter_nodes(query, (parent_id,), segment=segment)
+
+    def _get_children(self, parent):
+        """
+        :param SqliteNode parent: A node
+        :return: The children of the node.
+        :rtype: set[SqliteNode]
+        """
+        if parent.rowid is None:
+            return set()
+        query = "SELECT %s FROM nodes WHERE parent = ?" % _NODE_COLUMNS
+        return set(self._iter_nodes(query, (parent.rowid,)))
+
+    def _has_child(self, parent, name):
+        row = self._db.execute(
+            "SELECT 1 FROM nodes WHERE parent IS ? AND name = ? LIMIT 1",
+            (parent.rowid if parent else None, name),
+        ).fetchone()
+        return row is not None
+
+    def _unique_name(self, prefix, parent=None):
+        parent_id = parent.rowid if parent else None
+        key = parent_id, prefix
+        reserved = self._reserved_names.get(parent_id, ())
+
+        suffix = self._next_suffix.get(key, 1)
+        name = "%s%s" % (prefix, suffix)
+        while name in reserved or self._has_child(parent, name):
+            suffix += 1
+            name = "%s%s" % (prefix, suffix)
+        self._next_suffix[key] = suffix
+        return name
+
+    def reserve_unique_names(self, prefix, count, parent=None):
+        names = []
+        for _ in range(count):
+            name = self._unique_name(prefix, parent=parent)
+            self._reserved_names[parent.rowid if parent else None].add(name)
+            names.append(name)
+        return names
+
+    def _free_name(self, parent_id, name):
+        """
+        Make the name of a removed, renamed or re-parented node available for automatic naming.
+        This also release the name if it was reserved by `reserve_unique_names`.
+
+        :param parent_id: The row id of the parent. None for root nodes.
+        :type parent_id: int or None
+        :param str name: A node name.
+        """
+        names = self._reserved_names.get(parent_id)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self._reserved_names[parent_id]
+
+        split = _split_numeric_suffix(name)
+        if split:
+            prefix, suffix = split
+            key = parent_id, prefix
+            if suffix < self._next_suffix.get(key, 1):
+                self._next_suffix[key] = suffix
+
+    def _add_node(self, node_type, name, parent, emit):
+        name = self.intern_name(six.text_type(name))
+        node_type = self.intern_name(node_type)
+        parent_id = parent.rowid if parent else None
+        cursor = self._db.execute(
+            "INSERT INTO nodes (name, type, parent) VALUES (?, ?, ?)",
+            (name, node_type, parent_id),
+        )
+        node = self._load_node(cursor.lastrowid, name, node_type, parent_id)
+        if emit:
+            signal = self.onNodeAdded
+            LOG.debug("%s emitted with %s", signal, node)
+            signal.emit(node)
+        self._invalidate_melobjects((node.name,))
+
+        # Add port from configuration if needed
+        if self.schema and self.schema.get(node_type):
+            definitions, _, _ = self._get_schema_ports(node_type)
+            for port_name, definition in definitions.items():
+                self.create_port(node, port_name, definition=definition)
+
+        return node
+
+    def remove_node(self, node, emit=True):
+        for child in tuple(node.children):
+            self.remove_node(child, emit=emit)
+
+        # Remove any port that where used by the node.
+        for port in self.get_node_ports(node):
+            self.remove_port(port, emit=emit)
+
+        if emit:
+            self.onNodeRemoved.emit(node)
+
+        self._db.execute("DELETE FROM nodes WHERE id = ?", (node.rowid,))
+        self._nodes_cache.discard(node.rowid)
+        self._free_name(node.parent.rowid if node.parent else None, node.name)
+        node.rowid = None
+        self._invalidate_melobjects((node.name,))
+        node._melobject = None  # pylint: disable=protected-access
+        self._plug_cache.clear()
+        self.release_name(node.name)
+        self.release_name(node.type)
+
+    def _invalidate_melobjects(self, names):
+        for name in names:
+            rows = self._db.execute("SELECT id FROM nodes WHERE name = ?", (name,))
+            for (rowid,) in rows.fetchall():
+                node = self._nodes_cache.peek(rowid)
+                if node is not None:
+                    node._melobject = None  # pylint: disable=protected-access
+
+    def _on_node_renamed(self, node, old_name):
+        if node.rowid is None:
+            return
+        node._name = self.intern_name(node.name)  # pylint: disable=protected-access
+        self.release_name(old_name)
+        self._db.execute(
+            "UPDATE nodes SET name = ? WHERE id = ?", (node.name, node.rowid)
+        )
+        self._free_name(node.parent.rowid if node.parent else None, old_name)
+        self._plug_cache.clear()
+
+        # The children MEL representation can include the node name.
+        names = {child.name for child in node.iter_hierarchy()}
+        names.add(old_name)
+        self._invalidate_melobjects(names)
+
+    def _on_node_reparented(self, node, old_parent):
+        if node.rowid is None:
+            return
+        parent_id = node.parent.rowid if node.parent else None
+        self._db.execute(
+            "UPDATE nodes SET parent = ? WHERE id = ?", (parent_id, node.rowid)
+        )
+        self._free_name(old_parent.rowid if old_parent else None, node.name)
+        self._plug_cache.clear()
+        self._invalidate_melobjects({child.name for child in node.iter_hierarchy()})
+
+    # --- Ports
+
+    @track_query
+    def iter_port_by_match(self, pattern):
+        node_pattern, sep, port_pattern = pattern.partition(".")
+        if not sep:
+            if get_name_matcher(pattern).literal is None:
+                self._query_stats.scan("iter_port_by_match")
+            for port in self._iter_port_by_name_any_node(pattern):
+                yield port
+            return
+
+        matcher = get_name_matcher(port_pattern)
+        for node in self.iter_node_by_match(node_pattern):
+            if matcher.literal is not None:
+                query = (
+                    "SELECT %s FROM ports WHERE node = ? AND ? IN (name, short_name) "
+                    "ORDER BY name != ?, id LIMIT 1" % _PORT_COLUMNS
+                )
+                params = (node.rowid, matcher.literal, matcher.literal)
+                ports = self._iter_ports(query, params)
+            else:
+                query = "SELECT %s FROM ports WHERE node = ?" % _PORT_COLUMNS
+                ports = self._iter_ports(query, (node.rowid,), matcher=matcher)
+            for port in ports:
+                yield port
+
+    def _iter_port_by_name_any_node(self, pattern):
+        matcher = get_name_matcher(pattern)
+        if matcher.literal is not None:
+            query = "SELECT %s FROM ports WHERE name = ? OR short_name = ?"
+            params = (matcher.literal, matcher.literal)
+            return self._iter_ports(query % _PORT_COLUMNS, params)
+        query = "SELECT %s FROM ports" % _PORT_COLUMNS
+        return self._iter_ports(query, matcher=matcher)
+
+    def create_port(self, node, name, emit=True, **kwargs):
+        definition = kwargs.pop("definition", None)
+        value = kwargs.pop("value", 0)
+        if definition is None:
+            definition = AttributeDef.create(name, **kwargs)
+        definition = self._share_definition(node, definition, self._names)
+
+        cursor = self._db.execute(
+            "INSERT INTO ports "
+            "(node, name, short_name, nice_name, type, flags, parent, value) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                node.rowid,
+                definition.name,
+                definition.short_name,
+                definition.nice_name,
+                definition.type.name,
+                definition.flags,
+                definition.parent,
+                _dump_value(value),
+            ),
+        )
+        port = SqlitePort(node, definition, cursor.lastrowid)
+        self._ports_cache.add(port.rowid, port)
+        if emit:
+            self.onPortAdded.emit(port)
+        return port
+
+    def remove_port(self, port, emit=True):
+        # Remove any connection that used the port
+        connections = self.get_port_input_connections(port)
+        connections.update(self.get_port_output_connections(port))
+        for connection in connections:
+            self.remove_connection(connection, emit=emit)
+
+        if emit:
+            self.onPortRemoved.emit(port)
+
+        self._db.execute("DELETE FROM ports WHERE id = ?", (port.rowid,))
+        self._ports_cache.discard(port.rowid)
+        port.rowid = None
+        self._plug_cache.clear()
+        if not self._is_schema_definition(port):
+            port.definition.release(self._names)
+
+    @track_query
+    def get_node_ports(self, node):
+        return self._get_node_ports(node)
+
+    def _get_node_ports(self, node):
+        """
+        :param SqliteNode node: A node
+        :return: The ports of the node.
+        :rtype: set[SqlitePort]
+        """
+        query = "SELECT %s FROM ports WHERE node = ?" % _PORT_COLUMNS
+        return set(self._iter_ports(query, (node.rowid,)))
+
+    def _get_port_flags(self, node):
+        """
+        :param SqliteNode node: A node
+        :return: The bitwise or of the ports flags of the node.
+        :rtype: int
+        """
+        rows = self._db.execute("SELECT flags FROM ports WHERE node = ?", (node.rowid,))
+        flags = 0
+        for (port_flags,) in rows:
+            flags |= port_flags
+        return flags
+
+    @track_query
+    def get_node_ports_by_flags(self, node, flags):
+        query = "SELECT %s FROM ports WHERE node = ? AND flags & ? = ?" % _PORT_COLUMNS
+        return list(self._iter_ports(query, (node.rowid, flags, flags)))
+
+    @track_query
+    def get_node_port_by_name(self, node, name):
+        assert isinstance(node, MockedNode)
+        assert isinstance(name, six.string_types)
+
+        # A port long name have priority over a short name which have priority over a nice name.
+        query = (
+            "SELECT %s FROM ports WHERE node = ? AND ? IN (name, short_name, nice_name) "
+            "ORDER BY name != ?, short_name != ?, id LIMIT 1" % _PORT_COLUMNS
+        )
+        return next(self._iter_ports(query, (node.rowid, name, name, name)), None)
+
+    # --- Connections
+
+    def _add_connection(self, src, dst):
+        self._db.execute(
+            "INSERT INTO connections (src, dst) VALUES (?, ?)", (src.rowid, dst.rowid)
+        )
+        return self._get_connection(src, dst)
+
+    def remove_connection(self, connection, emit=True):
+        if emit:
+            self.onConnectionRemoved.emit(connection)
+        key = (connection.src.rowid, connection.dst.rowid)
+        self._db.execute("DELETE FROM connections WHERE src = ? AND dst = ?", key)
+        self._connections_cache.discard(key)
+
+    @track_query
+    def get_connection_by_ports(self, src, dst):
+        row = self._db.execute(
+            "SELECT 1 FROM connections WHERE src = ? AND dst = ?",
+            (src.rowid, dst.rowid),
+        ).fetchone()
+        return None if row is None else self._get_connection(src, dst)
+
+    def port_is_source(self, port):
+        row = self._db.execute(
+            "SELECT 1 FROM connections WHERE src = ? LIMIT 1", (port.rowid,)
+        ).fetchone()
+        return row is not None
+
+    def port_is_destination(self, port):
+        row = self._db.execute(
+            "SELECT 1 FROM connections WHERE dst = ? LIMIT 1", (port.rowid,)
+        ).fetchone()
+        return row is not None
+
+    def get_port_input_connections(self, port):
+        rows = self._db.execute(
+            "SELECT src FROM connections WHERE dst = ?", (port.rowid,)
+        ).fetchall()
+        return {self._get_connection(self._get_port(src), port) for (src,) in rows}
+
+    def get_port_output_connections(self, port):
+        rows = self._db.execute(
+            "SELECT dst FROM connections WHERE src = ?", (port.rowid,)
+        ).fetchall()
+        return {self._get_connection(port, self._get_port(dst)) for (dst,) in rows}
@@ -1,8 +1,11 @@
 """
 Observer pattern implementation
 """
+import functools
 import logging
 import threading
+import types
+import weakref
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
@@ -11,11 +14,72 @@ LOG.setLevel(logging.INFO)
 # TODO: Implement __str__ that namespace sender?
 
 
+class _WeakMethod(object):
+    """
+    Weak reference to a bound method.
+    Similar to `weakref.WeakMethod` which is not available in python-2.
+
+    :param method: A bound method
+    :param callback: If provided, called with the reference when the method object is collected.
+    :type callback: callable or None
+    """
+
+    __slots__ = ("_obj", "_func", "__weakref__")
+
+    def __init__(self, method, callback=None):
+        self._obj = weakref.ref(
+            method.__self__, None if callback is None else lambda _: callback(self)
+        )
+        self._func = method.__func__
+
+    def __call__(self):
+        """
+        :return: The bound method. None if it's object was collected.
+        :rtype: callable or None
+        """
+        obj = self._obj()
+        return None if obj is None else self._func.__get__(obj, type(obj))
+
+
+WeakMethod = getattr(weakref, "WeakMethod", _WeakMethod)
+
+
+class _StrongRef(object):
+    """
+    Strong reference to a callable with the same interface as a weak reference.
+    """
+
+    __slots__ = ("_func",)
+
+    def __init__(self, func):
+        self._func = func
+
+    def __call__(self):
+        return self._func
+
+
+def _get_key(func):
+    """
+    :param callable func: A callable
+    :return: A key that identify the callable.
+    Bound methods are identified by their object and function
+    since a new method object is created each time they are accessed.
+    :rtype: object
+    """
+    if not isinstance(func, types.MethodType) or func.__self__ is None:
+        return func
+    return id(func.__self__), func.__func__
+
+
 class Signal(object):
     """
     Observer pattern implementation.
     Match QtCore.Signal interface for convenience.
 
+    Like with QtCore.Signal, bound methods are weakly referenced.
+    They are disconnected automatically when their object is collected.
+    Other callables are strongly referenced.
+
     Q1: Why no use QtCore.Signal instead?
     A1: QtCore.Signal is compiled and cannot be inspected
         with breakpoints which make debugging harder.
@@ -23,7 +87,9 @@ class Signal(object):
 
     def __init__(self, *_):
         self._mutex = threading.RLock()
-        self._funcs = set()
+
+        # References to the connected callables by their key, see `_get_key`.
+        self._funcs = {}
         self._block = False
 
     def __repr__(self):
@@ -37,7 +103,12 @@ class Signal(object):
         :param object func: A callable object to connect to the signal.
         """
         LOG.debug("Connecting %s to Signal %s", func.__name__, self)
-        self._funcs.add(func)
+        key = _get_key(func)
+        if isinstance(key, tuple):
+            ref = WeakMethod(func, functools.partial(self._on_collected, key))
+        else:
+            ref = _StrongRef(func)
+        self._funcs[key] = ref
 
     def disconnect(self, func):
         """
@@ -46,7 +117,17 @@ class Signal(object):
         :param object func: A callable object to disconnect from the signal.
         """
         LOG.debug("Disconnecting %s from Signal %s", func.__name__, self)
-        self._funcs.remove(func)
+        del self._funcs[_get_key(func)]
+
+    def _on_collected(self, key, ref):
+        """
+        Called when the object of a connected method is collected.
+
+        :param tuple key: The key of the method.
+        :param WeakMethod ref: The reference to the method.
+        """
+        if self._funcs.get(key) is ref:
+            del self._funcs[key]
 
     def emit(self, *args, **kwargs):
         """
@@ -63,8 +144,10 @@ class Signal(object):
         self._mutex.acquire()
         self.block(True)
         try:
-            for func in self._funcs:
-                func(*args, **kwargs)
+            for ref in tuple(self._funcs.values()):
+                func = ref()
+                if func is not None:
+                    func(*args, **kwargs)
         finally:
             self._mutex.release()
             self.block(False)
@@ -2,7 +2,7 @@
 Mocks for a `maya.cmds` session
 """
 # TODO: Implement cmds.allNodeTypes
-from maya_mock.base import MockedSession
+from maya_mock.base import MockedSession, constants
 from maya_mock.base._utils import handle_arguments, redirect_method_args_to_arg
 
 
@@ -43,7 +43,9 @@ class MockedCmdsSession(object):
         attributeType="at",
         dataType="dt",
         defaultValue="dv",
+        keyable="k",
         longName="ln",
+        multi="m",
         niceName="nn",
         shortName="sn",
     )  # pylint: disable=invalid-name,too-many-arguments
@@ -53,7 +55,9 @@ class MockedCmdsSession(object):
         attributeType=None,
         dataType=None,
         defaultValue=0.0,
+        keyable=False,
         longName=None,
+        multi=False,
         niceName=None,
         shortName=None,
     ):  # pylint: disable: invalid-name,too-many-arguments
@@ -65,7 +69,9 @@ class MockedCmdsSession(object):
         :param str attributeType: The attribute type
         :param str dataType: The attribute data type
         :param object defaultValue: The attribute default value
+        :param bool keyable: If True, the attribute can be keyed
         :param str longName: The attribute long name
+        :param bool multi: If True, the attribute is an array
         :param str shortName: The attribute short name
         :param tuple[str] objects: Objects to add the attribute to
         """
@@ -78,8 +84,18 @@ class MockedCmdsSession(object):
         name = longName or shortName
         port_type = attributeType or dataType or "float"
 
-        for object_ in objects:
-            node = self.session.get_node_by_match(object_)
+        nodes = [self.session.get_node_by_match(object_) for object_ in objects]
+
+        # Like Maya, an attribute name cannot be used by another attribute of the node.
+        for node in nodes:
+            for alias in (longName, shortName, niceName):
+                if alias and self.session.get_node_port_by_name(node, alias):
+                    raise RuntimeError(
+                        "Name %r of new attribute clashes with an existing attribute of node %r."
+                        % (alias, node.__melobject__())
+                    )
+
+        for node in nodes:
             self.session.create_port(
                 node,
                 name,
@@ -87,6 +103,8 @@ class MockedCmdsSession(object):
                 short_name=shortName,
                 value=defaultValue,
                 nice_name=niceName,
+                keyable=keyable,
+                multi=multi,
             )
 
     @handle_arguments(name="n", parent="p", skipSelect="ss")
@@ -244,33 +262,53 @@ class MockedCmdsSession(object):
         return port.value
 
     @redirect_method_args_to_arg
-    @handle_arguments(userDefined="ud")
-    def listAttr(self, objects, userDefined=False):  # pylint: disable=invalid-name
+    @handle_arguments(
+        userDefined="ud", read="r", write="w", keyable="k", multi="m"
+    )  # pylint: disable=too-many-arguments
+    def listAttr(
+        self,
+        objects,
+        userDefined=False,
+        read=False,
+        write=False,
+        keyable=False,
+        multi=False,
+    ):  # pylint: disable=invalid-name,too-many-arguments
         """
         List node attributes (ports).
 
         https://help.autodesk.com/cloudhelp/2017/ENU/Maya-Tech-Docs/Commands/listAttr.html
 
         :param tuple[str] objects: Objects to list attributes from
+        :param bool userDefined: If True, only list user defined attributes.
+        :param bool read: If True, only list readable attributes.
+        :param bool write: If True, only list writable attributes.
+        :param bool keyable: If True, only list keyable attributes.
+        :param bool multi: If True, only list multi attributes.
         :return: A list of attribute names
         :rtype: list[str]
         """
-
-        def _filter_port(port):
-            if userDefined and not port.user_defined:
-                return False
-            return True
+        flags = 0
+        for flag, enabled in (
+            (constants.PORT_USER_DEFINED, userDefined),
+            (constants.PORT_READABLE, read),
+            (constants.PORT_WRITABLE, write),
+            (constants.PORT_KEYABLE, keyable),
+            (constants.PORT_MULTI, multi),
+        ):
+            if enabled:
+                flags |= flag
 
         nodes = {
             node
             for object_ in objects
             for node in self.session.get_nodes_by_match(object_)
         }
-        ports = (
-            port for node in nodes for port in self.session.ports_by_node.get(node, {})
-        )
-        ports = filter(_filter_port, ports)
-        return [port.name for port in ports]
+        return [
+            port.name
+            for node in nodes
+            for port in self.session.get_node_ports_by_flags(node, flags)
+        ]
 
     @redirect_method_args_to_arg
     @handle_arguments(long="l", selection="sl", type="typ")
@@ -310,9 +348,12 @@ class MockedCmdsSession(object):
                 return n.dagpath
             return n.__melobject__()
 
-        nodes = [
-            node for node in self.session.iter_node_by_match(pattern) if _filter(node)
-        ]
+        if type and pattern is None:
+            candidates = self.session.iter_nodes_by_type(type)
+        else:
+            candidates = self.session.iter_node_by_match(pattern)
+
+        nodes = [node for node in candidates if _filter(node)]
         return [_get(node) for node in sorted(nodes)]
 
     @handle_arguments()
@@ -10,6 +10,8 @@ class MockedPymelNode(object):
     https://help.autodesk.com/cloudhelp/2018/CHS/Maya-Tech-Docs/PyMel/generated/classes/pymel.core.general/pymel.core.general.PyNode.html#pymel.core.general.PyNode
     """
 
+    __slots__ = ("__pymel", "__session", "_node", "selected", "__weakref__")
+
     def __init__(self, pymel, node):
         """
         :param maya_mock.MockedPymelSession pymel: A mocked pymel session
@@ -8,6 +8,8 @@ class MockedPymelPort(object):
     https://help.autodesk.com/cloudhelp/2018/CHS/Maya-Tech-Docs/PyMel/generated/classes/pymel.core.general/pymel.core.general.Attribute.html#pymel.core.general.Attribute
     """
 
+    __slots__ = ("__session", "_port", "__weakref__")
+
     def __init__(self, session, port):
         """
         :param maya_mock.MockedSession session: A mocked session
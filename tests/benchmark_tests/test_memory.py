@@ -0,0 +1,94 @@
+"""
+Memory benchmarks.
+
+Theses tests are not part of the unit tests.
+Run them with `pytest -s tests/benchmark_tests` to display the results.
+"""
+# pylint: disable=redefined-outer-name
+import pytest
+
+from maya_mock import (
+    MockedSession,
+    MockedSessionSchema,
+    MockedPymelSession,
+    MockedSqliteSession,
+)
+from maya_mock.base.schema import NodeTypeDef
+
+tracemalloc = pytest.importorskip("tracemalloc")  # pylint: disable=invalid-name
+
+_NODE_COUNT = 1000
+_PORT_COUNT = 100
+
+
+@pytest.fixture
+def schema():
+    """
+    Create a schema with a node type that have a lot of attributes,
+    similar to what we would find in a schema generated from Maya.
+
+    :rtype: MockedSessionSchema
+    """
+    attributes = {
+        "attribute%s"
+        % i: {
+            "port_type": "double",
+            "short_name": "attr%s" % i,
+            "nice_name": "Attribute %s" % i,
+            "parent": None,
+            "readable": True,
+            "writable": True,
+        }
+        for i in range(_PORT_COUNT)
+    }
+    node_def = NodeTypeDef("transform", attributes, "drawdb/geometry/transform")
+    return MockedSessionSchema(nodes={"transform": node_def})
+
+
+def _measure_bytes_per_node(session):
+    """
+    Measure the memory allocated when creating nodes in a session.
+
+    :param MockedSession session: The session to create nodes in.
+    :return: The number of bytes allocated for each node.
+    :rtype: float
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        nodes = [session.create_node("transform") for _ in range(_NODE_COUNT)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(nodes) == _NODE_COUNT
+    return float(after - before) / _NODE_COUNT
+
+
+def test_memory_per_node(schema):
+    """Measure the memory used by a node and it's ports."""
+    session = MockedSession(schema=schema)
+    result = _measure_bytes_per_node(session)
+    print("\n%d bytes per node with %d ports" % (result, _PORT_COUNT))
+
+
+def test_memory_per_node_sqlite(schema):
+    """Measure the memory used by a node when the session is stored in a database."""
+    session = MockedSqliteSession(schema=schema)
+    result = _measure_bytes_per_node(session)
+    print("\n%d bytes per node with %d ports (sqlite)" % (result, _PORT_COUNT))
+
+
+def test_memory_per_node_pymel(schema):
+    """Measure the memory used by a node and it's ports with a pymel adaptor."""
+    session = MockedSession(schema=schema)
+    MockedPymelSession(session)
+    result = _measure_bytes_per_node(session)
+    print("\n%d bytes per node with %d ports (pymel)" % (result, _PORT_COUNT))
+
+
+def test_memory_per_node_lazy(schema):
+    """Measure the memory used by a node when it's ports are created lazily."""
+    session = MockedSession(schema=schema, lazy_ports=True)
+    result = _measure_bytes_per_node(session)
+    print("\n%d bytes per node with %d lazy ports" % (result, _PORT_COUNT))
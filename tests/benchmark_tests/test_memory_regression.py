@@ -0,0 +1,186 @@
+"""
+Memory regression suite.
+
+Standard scenes of different sizes are built in a fresh interpreter
+and the memory allocated for each category of objects is measured with `tracemalloc`.
+
+Theses tests are not part of the unit tests.
+Run them with `pytest -s tests/benchmark_tests/test_memory_regression.py`.
+
+The suite is configured with environment variables:
+
+- MAYA_MOCK_MEMORY_SCALES: Comma separated numbers of nodes. ex: `1000,10000,100000`
+- MAYA_MOCK_MEMORY_BUDGET: Maximum retained bytes per node. Default to the values in `_BUDGETS`.
+- MAYA_MOCK_MEMORY_OUTPUT: Path to a json file to write the results to. Not written by default.
+"""
+# pylint: disable=redefined-outer-name,protected-access
+import collections
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import pytest
+
+from maya_mock import MockedSession, MockedSessionSchema, MockedPymelSession
+from maya_mock.base.schema import NodeTypeDef
+
+tracemalloc = pytest.importorskip("tracemalloc")  # pylint: disable=invalid-name
+
+_SCALES = os.environ.get("MAYA_MOCK_MEMORY_SCALES", "1000,10000,100000")
+_SCALES = tuple(int(scale) for scale in _SCALES.split(","))
+_OUTPUT = os.environ.get("MAYA_MOCK_MEMORY_OUTPUT")
+_BUDGET = os.environ.get("MAYA_MOCK_MEMORY_BUDGET")
+
+# Number of attributes of the node type in the schema variant.
+_PORT_COUNT = 20
+
+# Default maximum retained bytes per node for a whole scene, by variant.
+_BUDGETS = {"empty": 4096, "schema": 20480}
+
+
+def _create_schema():
+    """
+    :return: A schema with a node type similar to the ones generated from Maya.
+    :rtype: MockedSessionSchema
+    """
+    attributes = {
+        "attribute%s"
+        % i: {
+            "port_type": "double",
+            "short_name": "attr%s" % i,
+            "nice_name": "Attribute %s" % i,
+        }
+        for i in range(_PORT_COUNT)
+    }
+    node_def = NodeTypeDef("transform", attributes, "drawdb/geometry/transform")
+    return MockedSessionSchema(nodes={"transform": node_def})
+
+
+def _measure(func):
+    """
+    Measure the memory allocated by a function.
+
+    :param callable func: A function that return the number of objects it created.
+    :return: The number of objects, the retained and peak allocated bytes.
+    :rtype: dict
+    """
+    tracemalloc.start()
+    try:
+        count = func()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return collections.OrderedDict(
+        (
+            ("count", count),
+            ("retained", retained),
+            ("peak", peak),
+            ("retained_per_object", float(retained) / count if count else 0.0),
+        )
+    )
+
+
+def build_scene(scale, variant):
+    """
+    Build a standard scene and measure the memory used by each category of objects.
+
+    The scene contain groups of ten transforms, each with an user defined attribute.
+    The attribute of every other node is connected to the next node.
+
+    :param int scale: The number of nodes in the scene.
+    :param str variant: 'schema' to create the nodes from a schema, 'empty' otherwise.
+    :return: The measures by category
+    :rtype: dict[str, dict]
+    """
+    session = MockedSession(schema=_create_schema() if variant == "schema" else None)
+    nodes = []
+    ports = []
+
+    def _create_nodes():
+        parent = None
+        for i in range(scale):
+            node = session.create_node("transform", parent=parent if i % 10 else None)
+            parent = node if i % 10 == 0 else parent
+            nodes.append(node)
+        return scale
+
+    def _create_ports():
+        ports.extend(session.create_port(node, "weight") for node in nodes)
+        return len(ports)
+
+    def _create_connections():
+        for src, dst in zip(ports[::2], ports[1::2]):
+            session.create_connection(src, dst)
+        return len(ports) // 2
+
+    def _create_pymel():
+        pymel = MockedPymelSession(session)
+        return len(pymel._registry)
+
+    result = collections.OrderedDict()
+    result["nodes"] = _measure(_create_nodes)
+    result["ports"] = _measure(_create_ports)
+    result["connections"] = _measure(_create_connections)
+    result["pymel"] = _measure(_create_pymel)
+    return result
+
+
+@pytest.fixture(scope="module")
+def results():
+    """
+    Collect the results of all the scenes and write them to disk if requested.
+
+    :rtype: list[dict]
+    """
+    results = []
+    yield results
+    if not _OUTPUT:
+        return
+    data = collections.OrderedDict(
+        (("python", platform.python_version()), ("results", results))
+    )
+    with open(_OUTPUT, "w") as stream:
+        json.dump(data, stream, indent=2)
+
+
+@pytest.mark.parametrize("variant", sorted(_BUDGETS))
+@pytest.mark.parametrize("scale", _SCALES)
+def test_memory_regression(results, scale, variant):
+    """Ensure the memory used by a scene stay within the budget."""
+    # Build the scene in a new interpreter so caches and signals
+    # from other scenes are not accounted for.
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output(
+        [sys.executable, __file__, str(scale), variant], env=env
+    )
+    categories = json.loads(output.decode("utf-8"))
+
+    retained = sum(category["retained"] for category in categories.values())
+    retained_per_node = float(retained) / scale
+    budget = float(_BUDGET) if _BUDGET else _BUDGETS[variant]
+    results.append(
+        collections.OrderedDict(
+            (
+                ("scale", scale),
+                ("variant", variant),
+                ("retained_per_node", retained_per_node),
+                ("budget", budget),
+                ("categories", categories),
+            )
+        )
+    )
+
+    print("\n%d nodes (%s): %d bytes per node" % (scale, variant, retained_per_node))
+    for name, category in categories.items():
+        print(
+            "  %s: %d objects, %d bytes retained, %d bytes peak"
+            % (name, category["count"], category["retained"], category["peak"])
+        )
+
+    assert retained_per_node <= budget
+
+
+if __name__ == "__main__":
+    sys.stdout.write(json.dumps(build_scene(int(sys.argv[1]), sys.argv[2])))
@@ -0,0 +1,78 @@
+"""
+Test cases for compiled patterns
+"""
+# pylint: disable=redefined-outer-name
+import pytest
+
+from maya_mock.base import matcher
+from maya_mock.base._utils import LRUCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Ensure each test start with empty caches."""
+    matcher.clear_cache()
+
+
+@pytest.mark.parametrize(
+    "pattern,name,expected",
+    (
+        ("foo", "foo", True),
+        ("foo", "foo1", False),
+        ("foo*", "foo1", True),
+        ("foo*", "bar1", False),
+        ("f?o", "foo", True),
+    ),
+)
+def test_name_matcher(pattern, name, expected):
+    """Validate name patterns are matched like fnmatch."""
+    assert matcher.get_name_matcher(pattern).match(name) == expected
+
+
+def test_name_matcher_literal():
+    """Validate a pattern without wildcard compile to a literal matcher."""
+    assert matcher.get_name_matcher("foo").literal == "foo"
+    assert matcher.get_name_matcher("foo*").literal is None
+
+
+def test_dagpath_matcher():
+    """Validate a dagpath pattern is split in segments."""
+    actual = matcher.get_dagpath_matcher("|a|b*")
+    assert actual.absolute
+    assert [segment.literal for segment in actual.segments] == ["a", None]
+    assert actual.segments[1].match("b1")
+    assert not actual.segments[1].match("a1")
+    assert not actual.optional_root
+
+
+def test_dagpath_matcher_optional_root():
+    """Validate a leading segment matching an empty name is optional."""
+    assert matcher.get_dagpath_matcher("*|b").optional_root
+    assert not matcher.get_dagpath_matcher("a*|b").optional_root
+    assert not matcher.get_dagpath_matcher("*").optional_root
+
+
+def test_dagpath_matcher_cached():
+    """Validate a dagpath pattern is only compiled once."""
+    assert matcher.get_dagpath_matcher("a|b") is matcher.get_dagpath_matcher("a|b")
+    info = matcher.cache_info()["dagpath"]
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_lru_cache_eviction():
+    """Validate the least recently used values are evicted first."""
+    calls = []
+
+    def _factory(key):
+        calls.append(key)
+        return key.upper()
+
+    cache = LRUCache(_factory, maxsize=2)
+    cache("a")
+    cache("b")
+    cache("a")
+    cache("c")  # evict 'b'
+    cache("a")
+    cache("b")
+    assert calls == ["a", "b", "c", "b"]
+    assert len(cache) == 2
@@ -1,6 +1,7 @@
 """
 Test cases for MockedNode
 """
+import weakref
 
 
 def test_dagpath(session):
@@ -52,3 +53,90 @@ def test_node_melobject_clashing(session):
     node2 = session.create_node("transform", name="parent")
     node3 = session.create_node("transform", name="A", parent=node2)
     assert node3.__melobject__() == "parent|A"
+
+
+def test_dagpath_cache_invalidation(session):
+    """Validate that a cached dagpath is updated when a parent is renamed or re-parented."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B", parent=node1)
+    node3 = session.create_node("transform", name="C", parent=node2)
+    other = session.create_node("transform", name="D")
+    assert node3.dagpath == "|A|B|C"
+
+    node1.name = "E"
+    assert node3.dagpath == "|E|B|C"
+
+    node2.set_parent(other)
+    assert node3.dagpath == "|D|B|C"
+    assert node1.dagpath == "|E"
+
+
+def test_dagpath_cache_stats(session):
+    """Validate that the dagpath cache statistics are updated."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B", parent=node1)
+    session.reset_stats()
+
+    assert node2.dagpath == "|A|B"
+    assert node2.dagpath == "|A|B"
+    node1.name = "C"
+    assert session.stats()["dagpath_cache"] == {
+        "hits": 1,
+        "misses": 2,
+        "invalidations": 2,
+    }
+
+
+def test_node_melobject_cache_invalidation(session):
+    """Assert a node MEL representation is updated when a clashing node is added or removed."""
+    node1 = session.create_node("transform", name="A")
+    parent = session.create_node("transform", name="parent")
+    assert node1.__melobject__() == "A"
+
+    node2 = session.create_node("transform", name="A", parent=parent)
+    assert node1.__melobject__() == "|A"
+    assert node2.__melobject__() == "parent|A"
+
+    parent.name = "other"
+    assert node2.__melobject__() == "other|A"
+
+    session.remove_node(node2)
+    assert node1.__melobject__() == "A"
+
+
+def test_node_melobject_cache_reparent(session):
+    """Assert a node MEL representation is updated when a clashing node is re-parented."""
+    node1 = session.create_node("transform", name="A")
+    parent = session.create_node("transform", name="parent")
+    node2 = session.create_node("transform", name="A", parent=parent)
+    assert node1.__melobject__() == "|A"
+
+    node1.set_parent(parent)
+    node1.name = "B"
+    assert node2.__melobject__() == "A"
+    assert node1.__melobject__() == "B"
+
+
+def test_node_slots(session):
+    """Validate that nodes don't allocate an instance dict."""
+    node = session.create_node("transform")
+    assert not hasattr(node, "__dict__")
+
+
+def test_node_weakref(session):
+    """Validate that nodes and ports can be weakly referenced despite their slots."""
+    node = session.create_node("transform")
+    port = session.create_port(node, "foo")
+    assert weakref.ref(node)() is node
+    assert weakref.ref(port)() is port
+
+
+def test_node_ports_snapshot(session):
+    """Assert the ports of a node cannot be used to modify the session."""
+    node = session.create_node("transform")
+    port = session.create_port(node, "foo")
+    ports = node.ports
+    assert ports == {port}
+    session.create_port(node, "bar")
+    assert ports == {port}
+    assert not hasattr(ports, "add")
@@ -6,6 +6,7 @@ import six
 import pytest
 
 from maya_mock import MockedSession, MockedPort
+from maya_mock.base.port import AttributeDef
 
 
 @pytest.fixture
@@ -59,3 +60,22 @@ def test_port_match(node, name, match, expected):
     """Validate the port match function."""
     port = MockedPort(node, name)
     assert port.match(match) == expected
+
+
+def test_port_hash_identity(session, node):
+    """Validate two ports are never equal even if they share the same dagpath."""
+    port1 = session.create_port(node, "foo")
+    port2 = MockedPort(node, "foo")
+    assert port1 != port2
+    assert len({port1, port2}) == 2
+
+
+def test_port_definition(node):
+    """Assert a port read it's attributes from it's definition."""
+    port = MockedPort(node, "foo", short_name="f", user_defined=False)
+    assert port.definition == AttributeDef.create(
+        "foo", short_name="f", user_defined=False
+    )
+    assert port.short_name == "f"
+    assert port.nice_name == "foo"
+    assert not port.user_defined
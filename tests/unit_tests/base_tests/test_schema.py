@@ -2,8 +2,12 @@
 Test cases for MockedSessionSchema
 """
 # pylint: disable=redefined-outer-name
+import json
+import os
+import stat
+
 import pytest
-from maya_mock import MockedSessionSchema
+from maya_mock import MockedSession, MockedSessionSchema
 from maya_mock.base.schema import NodeTypeDef
 
 
@@ -20,3 +24,192 @@ def test_register_node(schema):
     node_def = NodeTypeDef("transform", {}, "")
     schema.register_node(node_def)
     assert schema.get_known_node_types() == ["transform"]
+
+
+def test_inheritance():
+    """Assert inherited attributes are resolved once and shared with the parent type."""
+    parent = NodeTypeDef("dagNode", {"visibility": {"port_type": "bool"}}, "")
+    child = NodeTypeDef(
+        "dagNode.transform",
+        {"visibility": {"port_type": "bool"}, "translateX": {"port_type": "double"}},
+        "",
+        parent=parent,
+    )
+    assert child.to_dict()["attributes"] == {"translateX": {"port_type": "double"}}
+    assert sorted(child.data) == ["translateX", "visibility"]
+    assert child.data is child.data
+    assert child.attributes["visibility"] is parent.attributes["visibility"]
+    with pytest.raises(TypeError):
+        child.data["foo"] = {}
+
+
+def test_from_dict_inheritance():
+    """Assert the types of a serialized schema are linked to their parent."""
+    parent = NodeTypeDef("dagNode", {"visibility": {"port_type": "bool"}}, "")
+    child = NodeTypeDef(
+        "dagNode.shape.mesh", {"inMesh": {"port_type": "mesh"}}, "", parent=parent
+    )
+    schema = MockedSessionSchema(nodes={"dagNode": parent, "mesh": child})
+
+    schema = MockedSessionSchema.from_dict(schema.to_dict())
+    assert schema.get("mesh").parent is schema.get("dagNode")
+    assert sorted(schema.get("mesh").data) == ["inMesh", "visibility"]
+
+
+def test_compiled_json_file(tmpdir, monkeypatch):
+    """Assert a json schema is compiled and the compiled file is updated if the json change."""
+    path = str(tmpdir.join("schema.json"))
+    node_def = NodeTypeDef("transform", {"visibility": {"port_type": "bool"}}, "")
+    MockedSessionSchema(nodes={"transform": node_def}).to_json_file(path)
+
+    schema = MockedSessionSchema.from_json_file(path)
+    assert tmpdir.join("schema.json.cache").check()
+    assert schema.get("transform").data == {"visibility": {"port_type": "bool"}}
+
+    # The compiled file is used as long as the json file don't change
+    with monkeypatch.context() as context:
+        context.setattr(json, "load", None)
+        schema = MockedSessionSchema.from_json_file(path)
+        assert schema.get_known_node_types() == ["transform"]
+
+    MockedSessionSchema(default_state={"persp": "transform"}).to_json_file(path)
+    schema = MockedSessionSchema.from_json_file(path)
+    assert schema.get_known_node_types() == []
+    assert schema.default_state == {"persp": "transform"}
+
+
+@pytest.mark.skipif(
+    os.name != "posix", reason="Permissions are specific to posix systems"
+)
+def test_compiled_json_file_permissions(tmpdir):
+    """Assert the compiled file have the same permissions as any new file."""
+    path = str(tmpdir.join("schema.json"))
+    MockedSessionSchema().to_json_file(path)
+    MockedSessionSchema.from_json_file(path)
+
+    umask = os.umask(0)
+    os.umask(umask)
+    mode = stat.S_IMODE(os.stat(str(tmpdir.join("schema.json.cache"))).st_mode)
+    assert mode == 0o666 & ~umask
+
+
+def test_compiled_json_file_lazy(tmpdir):
+    """Assert the types of a compiled schema are only created when they are used."""
+    path = str(tmpdir.join("schema.json"))
+    parent = NodeTypeDef("dagNode", {"visibility": {"port_type": "bool"}}, "")
+    nodes = {
+        "dagNode": parent,
+        "mesh": NodeTypeDef("dagNode.shape.mesh", {}, "", parent=parent),
+        "nurbsCurve": NodeTypeDef("dagNode.shape.nurbsCurve", {}, "", parent=parent),
+    }
+    MockedSessionSchema(nodes=nodes).to_json_file(path)
+    MockedSessionSchema.from_json_file(path)
+
+    schema = MockedSessionSchema.from_json_file(path)
+    created = schema.nodes.data._nodes  # pylint: disable=protected-access
+    assert sorted(schema.get_known_node_types()) == ["dagNode", "mesh", "nurbsCurve"]
+    assert schema.get_node_type_descendants("dagNode") == ["mesh", "nurbsCurve"]
+    assert not created
+
+    assert schema.get("mesh").parent is schema.get("dagNode")
+    assert sorted(created) == ["dagNode", "mesh"]
+    assert schema.get("unknown") is None
+
+    schema.register_node(NodeTypeDef("transform", {}, ""))
+    assert len(schema.nodes) == 4
+    with pytest.raises(Exception):
+        schema.register_node(NodeTypeDef("dagNode.shape.nurbsCurve", {}, ""))
+
+    # Types which ancestors were unregistered can still be created.
+    del schema.nodes["dagNode"]
+    assert "nurbsCurve" in schema.nodes
+    assert schema.get("nurbsCurve").parent is None
+    assert schema.get("nurbsCurve").data == {}
+
+
+def test_shared_attribute_records():
+    """Assert equal attributes data of different node types are shared."""
+    port_data = {"port_type": "bool", "short_name": "v", "nice_name": "Visibility"}
+    data = {
+        "nodes": {
+            node_type: {
+                "namespace": node_type,
+                "attributes": {"visibility": dict(port_data)},
+                "classification": "",
+            }
+            for node_type in ("transform", "joint")
+        }
+    }
+    schema = MockedSessionSchema.from_dict(data)
+    transform, joint = schema.get("transform"), schema.get("joint")
+    assert transform.data["visibility"] is joint.data["visibility"]
+    assert transform.attributes["visibility"] is joint.attributes["visibility"]
+    assert len(transform.records) == 1
+
+
+@pytest.fixture
+def schema_hierarchy():
+    """
+    :rtype: MockedSessionSchema
+    """
+    schema = MockedSessionSchema()
+    dag_node = NodeTypeDef("dagNode", {}, "")
+    shape = NodeTypeDef("dagNode.shape", {}, "", parent=dag_node)
+    for node_def in (
+        dag_node,
+        shape,
+        NodeTypeDef("dagNode.shape.mesh", {}, "drawdb/geometry/mesh", parent=shape),
+        NodeTypeDef("dagNode.transform", {}, "drawdb/geometry/transform"),
+        NodeTypeDef("dagNodeExtra", {}, "utility/general"),
+    ):
+        schema.register_node(node_def)
+    return schema
+
+
+def test_namespace_indexes(schema_hierarchy):
+    """Assert node types can be resolved from their namespace and hierarchy."""
+    schema = schema_hierarchy
+    assert schema.get_node_by_namespace("dagNode.shape.mesh") is schema.get("mesh")
+    assert schema.get_node_by_namespace("mesh") is None
+    assert schema.get_node_type_ancestors("mesh") == ["dagNode", "shape"]
+    assert schema.get_node_type_descendants("dagNode") == ["shape", "mesh", "transform"]
+    assert schema.get_node_type_descendants("unknown") == []
+
+    schema.register_node(NodeTypeDef("dagNode.shape.nurbsCurve", {}, "drawdb/geometry"))
+    assert schema.get_node_type_descendants("shape") == ["mesh", "nurbsCurve"]
+
+    # The indexes are updated when the node types are modified directly.
+    schema.nodes["locator"] = NodeTypeDef("dagNode.shape.locator", {}, "")
+    del schema.nodes["mesh"]
+    assert schema.get_node_type_descendants("shape") == ["locator", "nurbsCurve"]
+    assert schema.get_node_by_namespace("dagNode.shape.mesh") is None
+
+
+def test_classification_index(schema_hierarchy):
+    """Assert node types can be found from a classification prefix."""
+    schema = schema_hierarchy
+    assert schema.get_node_types_by_classification("drawdb/geometry/") == [
+        "mesh",
+        "transform",
+    ]
+    assert schema.get_node_types_by_classification("utility") == ["dagNodeExtra"]
+
+
+def test_shared_attribute_records_in_session():
+    """Assert the ports of different node types share the schema definitions."""
+    parent = NodeTypeDef("dagNode", {"visibility": {"port_type": "bool"}}, "")
+    schema = MockedSessionSchema(
+        nodes={
+            "transform": NodeTypeDef("dagNode.transform", {}, "", parent=parent),
+            "joint": NodeTypeDef("dagNode.joint", {}, "", parent=parent),
+        }
+    )
+    session = MockedSession(schema=schema)
+    transform = session.create_node("transform")
+    joint = session.create_node("joint")
+    definition = schema.get("transform").attributes["visibility"]
+    assert definition is schema.get("joint").attributes["visibility"]
+    for node in (transform, joint):
+        assert (
+            session.get_node_port_by_name(node, "visibility").definition is definition
+        )
@@ -1,6 +1,25 @@
 """
 Test cases for MockedSession
 """
+# pylint: disable=redefined-outer-name
+import pytest
+
+from maya_mock import MockedSession
+from maya_mock.base.constants import PORT_KEYABLE
+from maya_mock.base.session_sqlite import MockedSqliteSession
+
+
+@pytest.fixture(params=(MockedSession, MockedSqliteSession), ids=("memory", "sqlite"))
+def session(request, schema):
+    """
+    Run each test against every session backend.
+
+    :rtype: MockedSession
+    """
+    session = request.param(schema=schema)
+    yield session
+    if isinstance(session, MockedSqliteSession):
+        session.close()
 
 
 def test_node_match(session):
@@ -52,3 +71,325 @@ def test_node_match_hyerarchy_dagpath(session):
     node1 = session.create_node("transform", name="A")
     node2 = session.create_node("transform", name="B", parent=node1)
     assert session.get_nodes_by_match("|A|B") == [node2]
+
+
+def test_get_node_by_name(session):
+    """Assert a node can be retrieved by it's name."""
+    node1 = session.create_node("transform", name="A")
+    session.create_node("transform", name="B")
+    assert session.get_node_by_name("A") is node1
+    assert session.get_node_by_name("C") is None
+
+
+def test_get_node_by_name_removed(session):
+    """Assert a removed node cannot be retrieved by it's name."""
+    node1 = session.create_node("transform", name="A")
+    session.remove_node(node1)
+    assert session.get_node_by_name("A") is None
+    assert not session.node_exist("A")
+
+
+def test_get_node_by_name_renamed(session):
+    """Assert a renamed node can only be retrieved by it's new name."""
+    node1 = session.create_node("transform", name="A")
+    node1.name = "B"
+    assert session.get_node_by_name("A") is None
+    assert session.get_node_by_name("B") is node1
+    assert session.get_nodes_by_match("B") == [node1]
+
+
+def test_node_match_partial_dagpath_wildcard(session):
+    """Assert a node can be matched by a partial dagpath containing a wildcard."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B", parent=node1)
+    node3 = session.create_node("transform", name="C", parent=node2)
+    session.create_node("transform", name="C", parent=node1)
+    assert session.get_nodes_by_match("A|*|C") == [node3]
+    assert session.get_nodes_by_match("|*|B|C") == [node3]
+
+
+def test_node_match_leading_wildcard_root(session):
+    """Assert a leading `*` segment can also match the root of the scene."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B", parent=node1)
+    node3 = session.create_node("transform", name="B")
+    assert session.get_nodes_by_match("*|B") == sorted([node2, node3])
+    assert session.get_nodes_by_match("*|A") == [node1]
+    assert session.get_nodes_by_match("|*|A", strict=False) == []
+
+
+def test_node_match_reparented(session):
+    """Assert a re-parented node is matched by it's new dagpath only."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B")
+    node2.set_parent(node1)
+    assert session.get_nodes_by_match("|A|B") == [node2]
+    assert session.get_nodes_by_match("|B", strict=False) == []
+
+
+def test_remove_node_hierarchy(session):
+    """Assert removing a node also remove it's children."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B", parent=node1)
+    session.remove_node(node1)
+    assert node2 not in session.nodes
+    assert session.get_nodes_by_match("B", strict=False) == []
+
+
+def test_get_node_port_by_name(session):
+    """Assert a port can be retrieved by it's long, short or nice name."""
+    node = session.create_node("transform")
+    port = session.create_port(node, "fooLong", short_name="foo", nice_name="Foo")
+    assert session.get_node_port_by_name(node, "fooLong") is port
+    assert session.get_node_port_by_name(node, "foo") is port
+    assert session.get_node_port_by_name(node, "Foo") is port
+    assert session.get_node_port_by_name(node, "bar") is None
+
+
+def test_get_node_port_by_name_priority(session):
+    """Assert a port long name have priority over another port short name."""
+    node = session.create_node("transform")
+    port1 = session.create_port(node, "barLong", short_name="foo")
+    port2 = session.create_port(node, "foo")
+    assert session.get_node_port_by_name(node, "foo") is port2
+    session.remove_port(port2)
+    assert session.get_node_port_by_name(node, "foo") is port1
+
+
+def test_remove_port(session):
+    """Assert a removed port cannot be retrieved anymore."""
+    node = session.create_node("transform")
+    port = session.create_port(node, "foo")
+    session.remove_port(port)
+    assert session.get_node_port_by_name(node, "foo") is None
+    assert port not in session.ports_by_node[node]
+
+
+def test_connection_queries(session):
+    """Assert connections can be queried from their ports."""
+    node = session.create_node("transform")
+    src = session.create_port(node, "src")
+    dst = session.create_port(node, "dst")
+    connection = session.create_connection(src, dst)
+    assert session.get_connection_by_ports(src, dst) is connection
+    assert session.get_connection_by_ports(dst, src) is None
+    assert session.port_is_source(src)
+    assert not session.port_is_source(dst)
+    assert session.port_is_destination(dst)
+    assert session.get_port_inputs(dst) == {src}
+    assert session.get_port_outputs(src) == {dst}
+
+
+def test_remove_port_connections(session):
+    """Assert removing a port also remove it's connections."""
+    node = session.create_node("transform")
+    src = session.create_port(node, "src")
+    dst = session.create_port(node, "dst")
+    session.create_connection(src, dst)
+    session.remove_port(src)
+    assert not session.connections
+    assert not session.port_is_destination(dst)
+    assert session.get_port_input_connections(dst) == set()
+
+
+def test_remove_self_connected_port(session):
+    """Assert a node can be removed when one of it's port is connected to itself."""
+    node = session.create_node("transform")
+    port = session.create_port(node, "foo")
+    session.create_connection(port, port)
+    session.remove_node(node)
+    assert not session.connections
+    assert not session.nodes
+
+
+def test_port_match_dagpath(session):
+    """Assert a port can be matched from an absolute or partial dagpath."""
+    node1 = session.create_node("transform", name="A")
+    node2 = session.create_node("transform", name="B", parent=node1)
+    port = session.create_port(node2, "fooLong", short_name="foo", nice_name="Foo")
+    assert session.get_port_by_match("|A|B.fooLong") is port
+    assert session.get_port_by_match("A|B.foo") is port
+    assert session.get_port_by_match("B.foo*") is port
+    assert session.get_port_by_match("B.Foo") is None
+    assert session.get_port_by_match("fooLong") is port
+
+
+def test_port_match_renamed(session):
+    """Assert a port cannot be matched by it's previous dagpath after a rename."""
+    node = session.create_node("transform", name="A")
+    port = session.create_port(node, "foo")
+    assert session.get_port_by_match("A.foo") is port
+    node.name = "B"
+    assert session.get_port_by_match("A.foo") is None
+    assert session.get_port_by_match("B.foo") is port
+
+
+def test_unique_name_reuse(session):
+    """Assert a name is available again once it's node is removed."""
+    nodes = [session.create_node("transform") for _ in range(3)]
+    session.remove_node(nodes[1])
+    assert session.create_node("transform").name == "transform2"
+    assert session.create_node("transform").name == "transform4"
+
+
+def test_unique_name_renamed(session):
+    """Assert a renamed node name is taken into account."""
+    node = session.create_node("transform", name="foo")
+    node.name = "transform1"
+    assert session.create_node("transform").name == "transform2"
+
+
+def test_unique_name_reparented_clash(session):
+    """Assert a name shared by re-parented siblings is still in use when one is removed."""
+    node = session.create_node("transform")
+    group = session.create_node("transform", name="g")
+    child = session.create_node("transform", name="transform1", parent=group)
+    child.set_parent(None)
+    session.remove_node(node)
+    assert session.create_node("transform").name == "transform2"
+
+
+def test_unique_name_per_parent(session):
+    """Assert unique names are resolved for each parent."""
+    parent = session.create_node("transform", name="parent")
+    session.create_node("transform", name="foo1")
+    assert session.create_node("transform", name="foo", parent=parent).name == "foo"
+    assert session.create_node("transform", name="foo1", parent=parent).name == "foo1"
+
+
+def test_reserve_unique_names(session):
+    """Assert reserved names are not used for automatic naming."""
+    assert session.reserve_unique_names("transform", 2) == ["transform1", "transform2"]
+    assert session.create_node("transform").name == "transform3"
+    assert session.create_node("transform", name="transform1").name == "transform1"
+
+
+def test_reparent_port_membership(session):
+    """Assert ports and connections can still be found after their node is re-parented."""
+    parent = session.create_node("transform", name="parent")
+    node = session.create_node("transform", name="A")
+    src = session.create_port(node, "src")
+    dst = session.create_port(node, "dst")
+    connection = session.create_connection(src, dst)
+    node.set_parent(parent)
+
+    assert src in session.ports
+    assert connection in session.connections
+    session.remove_port(src)
+    assert src not in session.ports_by_node[node]
+    assert not session.connections
+
+
+def test_names_are_interned(session):
+    """Assert equal nodes, ports and types names are shared between objects."""
+    node1 = session.create_node("".join(("trans", "form")), name="".join(("fo", "o")))
+    node2 = session.create_node("".join(("transf", "orm")))
+    node2.name = "".join(("f", "oo"))
+    assert node1.type is node2.type
+    assert node1.name is node2.name
+
+    port1 = session.create_port(node1, "".join(("ba", "r")))
+    port2 = session.create_port(node2, "".join(("b", "ar")))
+    assert port1.name is port2.name
+
+
+def test_names_are_released(session):
+    """Assert names are forgotten once no node or port use them."""
+    node1 = session.create_node("transform", name="foo")
+    node2 = session.create_node("transform", name="foo", parent=node1)
+    session.create_port(node2, "bar")
+    node1.name = "baz"
+    assert "foo" in session._names  # pylint: disable=protected-access
+    session.remove_node(node1)
+    assert "foo" not in session._names  # pylint: disable=protected-access
+    assert "bar" not in session._names  # pylint: disable=protected-access
+    assert "baz" not in session._names  # pylint: disable=protected-access
+
+    # Renaming a removed node don't affect the names of the scene.
+    node3 = session.create_node("transform", name="qux")
+    node2.name = "qux"
+    session.remove_node(node3)
+    assert "qux" not in session._names  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("columnar", (False, True), ids=("sets", "columns"))
+def test_iter_nodes_by_type(columnar):
+    """Assert we can query nodes by type with and without the columnar storage."""
+    session = MockedSession(columnar=columnar)
+    node1 = session.create_node("transform")
+    node2 = session.create_node("multiplyDivide")
+    node3 = session.create_node("transform", parent=node1)
+    session.remove_node(node1)
+    node4 = session.create_node("transform")
+
+    assert set(session.iter_nodes_by_type("transform")) == {node4}
+    assert set(session.iter_nodes_by_type("multiplyDivide")) == {node2}
+    assert set(session.iter_nodes_by_type("joint")) == set()
+    assert node3 not in session.nodes
+
+
+def test_columns_iter_nodes():
+    """Assert the nodes columns can be filtered by type and reuse the removed nodes ids."""
+    session = MockedSession(columnar=True)
+    columns = session._columns  # pylint: disable=protected-access
+    root1 = session.create_node("transform")
+    root2 = session.create_node("transform")
+    child1 = session.create_node("transform", parent=root1)
+    child2 = session.create_node("joint", parent=root1)
+
+    assert set(columns.iter_nodes()) == {root1, root2, child1, child2}
+    assert set(columns.iter_nodes("joint")) == {child2}
+
+    session.remove_node(root2)
+    child3 = session.create_node("joint")
+    assert set(columns.iter_nodes("joint")) == {child2, child3}
+    assert columns.get_type(columns.get_id(child3)) == "joint"
+
+
+def test_columns_many_types():
+    """Assert nodes types are told apart when types share the same column bucket."""
+    session = MockedSession(columnar=True)
+    nodes = [session.create_node("type%d" % i) for i in range(300)]
+    assert list(session.iter_nodes_by_type("type0")) == [nodes[0]]
+    assert list(session.iter_nodes_by_type("type255")) == [nodes[255]]
+
+
+def test_get_node_ports_by_flags_after_remove(session):
+    """Assert the node ports flags are updated when a port is removed."""
+    node = session.create_node("transform")
+    port = session.create_port(node, "foo", keyable=True)
+    assert session.get_node_ports_by_flags(node, PORT_KEYABLE) == [port]
+    session.remove_port(port)
+    assert session.get_node_ports_by_flags(node, PORT_KEYABLE) == []
+    assert session._port_flags[node] == 0  # pylint: disable=protected-access
+
+
+def test_stats(session):
+    """Assert the session statistics report the containers size and the query scans."""
+    node = session.create_node("transform", name="A")
+    port = session.create_port(node, "foo")
+    session.remove_port(session.create_port(session.create_node("transform"), "bar"))
+    session.reset_stats()
+
+    assert session.get_node_by_name("A") is node
+    assert session.get_nodes_by_match("A*") == [node]
+    assert list(session.iter_port_by_match("f*")) == [port]
+    assert list(session.iter_port_by_match("A.foo")) == [port]
+
+    stats = session.stats()
+    assert stats["nodes"] == 2
+    assert stats["ports"] == 1
+    assert stats["ports_by_node"] == 2
+    assert stats["ports_by_node_stale"] == 1
+
+    queries = stats["queries"]
+    assert queries["get_node_by_name"].calls == 1
+    assert queries["get_node_by_name"].scans == 0
+    assert queries["iter_node_by_match"].calls == 2
+    assert queries["iter_node_by_match"].scans == 1
+    assert queries["iter_port_by_match"].calls == 2
+    assert queries["iter_port_by_match"].scans == 1
+    assert queries["iter_port_by_match"].time >= 0.0
+
+    session.reset_stats()
+    assert session.stats()["queries"] == {}
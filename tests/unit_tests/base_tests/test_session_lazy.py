@@ -0,0 +1,146 @@
+"""
+Test cases for MockedSession with lazy ports.
+Every test is ran with and without lazy ports to ensure the results are the same.
+"""
+# pylint: disable=redefined-outer-name
+import pytest
+
+from maya_mock import MockedSession, MockedSessionSchema, MockedCmdsSession
+from maya_mock.base.constants import PORT_KEYABLE, PORT_MULTI, PORT_READABLE
+from maya_mock.base.schema import NodeTypeDef
+
+
+@pytest.fixture
+def schema():
+    """
+    :rtype: MockedSessionSchema
+    """
+    data = {
+        "translateX": {
+            "port_type": "doubleLinear",
+            "short_name": "tx",
+            "keyable": True,
+        },
+        "translateY": {"port_type": "doubleLinear", "short_name": "ty"},
+        "visibility": {"port_type": "bool", "short_name": "v", "nice_name": "Vis"},
+    }
+    node_def = NodeTypeDef("transform", data, "drawdb/geometry/transform")
+    return MockedSessionSchema(nodes={"transform": node_def})
+
+
+@pytest.fixture(params=(False, True), ids=("eager", "lazy"))
+def session(request, schema):
+    """
+    :rtype: MockedSession
+    """
+    return MockedSession(schema=schema, lazy_ports=request.param)
+
+
+@pytest.fixture
+def cmds(session):
+    """
+    :rtype: MockedCmdsSession
+    """
+    return MockedCmdsSession(session)
+
+
+def test_lazy_ports_not_created(schema):
+    """Validate that schema ports are not created until they are needed."""
+    session = MockedSession(schema=schema, lazy_ports=True)
+    node = session.create_node("transform")
+    assert not session.ports
+    port = session.get_node_port_by_name(node, "tx")
+    assert port.name == "translateX"
+    assert session.ports == {port}
+
+
+def test_get_node_port_by_name(session):
+    """Validate schema ports can be retrieved by any of their name."""
+    node = session.create_node("transform")
+    assert session.get_node_port_by_name(node, "translateX").name == "translateX"
+    assert session.get_node_port_by_name(node, "v").name == "visibility"
+    assert session.get_node_port_by_name(node, "Vis").name == "visibility"
+    assert session.get_node_port_by_name(node, "unknown") is None
+
+
+def test_listAttr(cmds):  # pylint: disable=invalid-name
+    """Validate listAttr return all the schema ports."""
+    node = cmds.createNode("transform")
+    cmds.addAttr(node, longName="foo")
+    assert sorted(cmds.listAttr(node)) == [
+        "foo",
+        "translateX",
+        "translateY",
+        "visibility",
+    ]
+    assert cmds.listAttr(node, userDefined=True) == ["foo"]
+
+
+def test_listAttr_flags(cmds):  # pylint: disable=invalid-name
+    """Validate listAttr can filter schema ports by their flags."""
+    node = cmds.createNode("transform")
+    assert cmds.listAttr(node, keyable=True) == ["translateX"]
+    assert cmds.listAttr(node, userDefined=True) == []
+
+
+def test_get_node_ports_by_flags(session):
+    """Validate nodes without any matching port are skipped."""
+    node = session.create_node("transform")
+    count = len(session.ports)
+    assert session.get_node_ports_by_flags(node, PORT_MULTI) == []
+    assert len(session.ports) == count
+    ports = session.get_node_ports_by_flags(node, PORT_KEYABLE | PORT_READABLE)
+    assert [port.name for port in ports] == ["translateX"]
+
+
+def test_get_port_by_match(session):
+    """Validate schema ports can be matched by pattern."""
+    session.create_node("transform", name="A")
+    assert session.get_port_by_match("A.ty").name == "translateY"
+    assert session.get_port_by_match("A.Vis") is None
+    assert session.get_port_by_match("translateX").name == "translateX"
+    assert {port.name for port in session.iter_port_by_match("A.translate*")} == {
+        "translateX",
+        "translateY",
+    }
+    assert {port.name for port in session.iter_port_by_match("t*")} == {
+        "translateX",
+        "translateY",
+    }
+
+
+def test_connectAttr(cmds):  # pylint: disable=invalid-name
+    """Validate schema ports can be connected."""
+    cmds.createNode("transform", name="A")
+    cmds.createNode("transform", name="B")
+    cmds.connectAttr("A.tx", "B.ty")
+    assert (
+        cmds.connectionInfo("B.translateY", sourceFromDestination=True)
+        == "A.translateX"
+    )
+
+
+def test_remove_port(session):
+    """Validate a removed schema port is not created again."""
+    node = session.create_node("transform")
+    session.remove_node_port(node, "translateX")
+    assert session.get_node_port_by_name(node, "translateX") is None
+    assert {port.name for port in node.ports} == {"translateY", "visibility"}
+
+
+def test_port_definitions_are_shared(session):
+    """Assert ports created from the same schema type share their definition."""
+    node1 = session.create_node("transform")
+    node2 = session.create_node("transform")
+    port1 = session.get_node_port_by_name(node1, "translateX")
+    port2 = session.get_node_port_by_name(node2, "translateX")
+    assert port1.definition is port2.definition
+    assert port1.short_name == "tx"
+    assert not port1.user_defined
+
+
+def test_port_definitions_are_the_schema_ones(session):
+    """Assert ports created from a schema type use the schema definitions as is."""
+    node = session.create_node("transform")
+    port = session.get_node_port_by_name(node, "translateX")
+    assert port.definition is session.schema.get("transform").attributes["translateX"]
@@ -0,0 +1,171 @@
+"""
+Test cases for MockedSqliteSession
+"""
+# pylint: disable=redefined-outer-name,protected-access
+import gc
+
+import pytest
+
+from maya_mock import MockedSqliteSession, MockedSessionSchema, MockedCmdsSession
+from maya_mock.base.schema import NodeTypeDef
+
+
+@pytest.fixture
+def schema():
+    """
+    :rtype: MockedSessionSchema
+    """
+    data = {
+        "translateX": {"port_type": "doubleLinear", "short_name": "tx"},
+        "visibility": {"port_type": "bool", "short_name": "v", "nice_name": "Vis"},
+    }
+    node_def = NodeTypeDef("transform", data, "drawdb/geometry/transform")
+    return MockedSessionSchema(nodes={"transform": node_def})
+
+
+@pytest.fixture
+def session(schema):
+    """
+    :rtype: MockedSqliteSession
+    """
+    session = MockedSqliteSession(schema=schema, cache_size=1)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def cmds(session):
+    """
+    :rtype: MockedCmdsSession
+    """
+    return MockedCmdsSession(session)
+
+
+def test_node_match(session):
+    """Assert nodes can be matched by name, partial and absolute dagpath."""
+    parent = session.create_node("transform", name="a")
+    child = session.create_node("transform", name="b", parent=parent)
+    other = session.create_node("transform", name="b")
+    assert session.get_nodes_by_match("b") == [child, other]
+    assert session.get_nodes_by_match("a|b") == [child]
+    assert session.get_nodes_by_match("|b") == [other]
+    assert session.get_nodes_by_match("|a|*") == [child]
+    assert session.get_node_by_name("a") is parent
+    assert len(session) == 3
+
+
+def test_unique_names(session):
+    """Assert automatic names are resolved from the database."""
+    session.create_node("transform")
+    session.create_node("transform")
+    node = session.create_node("transform", name="transform1")
+    assert node.name == "transform3"
+    assert session.reserve_unique_names("transform", 2) == ["transform4", "transform5"]
+    assert session.create_node("transform").name == "transform6"
+
+
+def test_nodes_are_reloaded(session):
+    """Assert nodes and ports that are not in use are released and loaded again when needed."""
+    node = session.create_node("transform", name="foo")
+    session.create_port(node, "bar", value=10)
+    del node
+    session.create_node("transform")
+    gc.collect()
+    assert len(session._nodes_cache) == 1
+    assert len(session._ports_cache) == 1
+
+    node = session.get_node_by_name("foo")
+    assert session.get_node_port_by_name(node, "bar").value == 10
+    assert session.get_node_by_name("foo") is node
+
+
+def test_schema_ports(session):
+    """Assert schema ports are stored and share their definitions once loaded again."""
+    session.create_node("transform", name="foo")
+    gc.collect()
+    port = session.get_port_by_match("foo.tx")
+    definition = session._get_schema_ports("transform")[0]["translateX"]
+    assert port.definition is definition
+    assert session.get_port_by_match("foo.Vis") is None
+    assert session.get_node_port_by_name(port.node, "Vis").name == "visibility"
+
+
+def test_rename_reparent(session):
+    """Assert renamed and re-parented nodes are updated in the database."""
+    parent = session.create_node("transform", name="a")
+    child = session.create_node("transform", name="b")
+    child.set_parent(parent)
+    child.name = "c"
+    assert child.dagpath == "|a|c"
+    assert parent.children == {child}
+    assert session.get_nodes_by_match("|a|c") == [child]
+    assert not session.node_exist("b")
+
+
+def test_rename_keep_unrelated_melobjects(session):
+    """Assert renaming a node only invalidate the MEL representation of it's hierarchy."""
+    parent = session.create_node("transform", name="a")
+    child = session.create_node("transform", name="b", parent=parent)
+    other = session.create_node("transform", name="c")
+    assert child.__melobject__() == "b"
+    assert other.__melobject__() == "c"
+    parent.name = "d"
+    assert child._melobject is None  # pylint: disable=protected-access
+    assert other._melobject == "c"  # pylint: disable=protected-access
+
+
+def test_remove_node(session):
+    """Assert removing a node also remove it's children, ports and connections."""
+    parent = session.create_node("transform", name="a")
+    child = session.create_node("transform", name="b", parent=parent)
+    other = session.create_node("transform", name="c")
+    session.create_connection(
+        session.get_node_port_by_name(child, "tx"),
+        session.get_node_port_by_name(other, "tx"),
+    )
+    session.remove_node(parent)
+    assert session.nodes == {other}
+    assert len(session.ports) == 2
+    assert not session.connections
+
+
+def test_connections(session):
+    """Assert connections can be queried from their ports."""
+    node = session.create_node("transform")
+    src = session.create_port(node, "src")
+    dst = session.create_port(node, "dst")
+    connection = session.create_connection(src, dst)
+    assert session.get_connection_by_ports(src, dst) is connection
+    assert session.get_port_input_connections(dst) == {connection}
+    assert next(iter(session.connections)) is connection
+    assert session.get_connection_by_ports(dst, src) is None
+    assert session.port_is_source(src)
+    assert session.port_is_destination(dst)
+    assert session.get_port_inputs(dst) == {src}
+    assert session.get_port_outputs(src) == {dst}
+
+    session.remove_port(src)
+    assert not session.port_is_destination(dst)
+
+
+def test_cmds(cmds):
+    """Assert the cmds adaptor work with a database session."""
+    node = cmds.createNode("transform", name="foo")
+    cmds.addAttr(node, longName="bar")
+    cmds.setAttr("foo.bar", 3.0)
+    cmds.connectAttr("foo.bar", "foo.tx")
+    assert cmds.getAttr("foo.bar") == 3.0
+    assert cmds.listAttr(node, userDefined=True) == ["bar"]
+    assert cmds.ls(type="transform") == ["foo"]
+    assert cmds.objExists("foo.tx")
+
+
+def test_stats(session):
+    """Assert the session statistics are computed from the database."""
+    node = session.create_node("transform", name="foo")
+    session.reset_stats()
+    assert session.get_nodes_by_match("f*") == [node]
+
+    stats = session.stats()
+    assert (stats["nodes"], stats["ports"], stats["connections"]) == (1, 2, 0)
+    assert stats["queries"]["iter_node_by_match"].scans == 1
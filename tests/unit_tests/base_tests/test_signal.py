@@ -0,0 +1,75 @@
+"""
+Test cases for Signal
+"""
+# pylint: disable=redefined-outer-name
+import gc
+
+import pytest
+
+from maya_mock.base.signal import Signal, _WeakMethod
+
+
+class _Listener(object):
+    def __init__(self):
+        self.calls = []
+
+    def callback(self, value):
+        """Remember the emitted value."""
+        self.calls.append(value)
+
+
+@pytest.fixture
+def signal():
+    """
+    :rtype: Signal
+    """
+    return Signal(int)
+
+
+def test_emit(signal):
+    """Assert functions and bound methods are called when the signal is emitted."""
+    calls = []
+
+    def _callback(value):
+        calls.append(value)
+
+    listener = _Listener()
+    signal.connect(_callback)
+    signal.connect(listener.callback)
+    signal.emit(1)
+    assert calls == [1]
+    assert listener.calls == [1]
+
+
+def test_disconnect(signal):
+    """Assert a bound method can be disconnected from a different method object."""
+    listener = _Listener()
+    signal.connect(listener.callback)
+    signal.disconnect(listener.callback)
+    signal.emit(1)
+    assert listener.calls == []
+    with pytest.raises(KeyError):
+        signal.disconnect(listener.callback)
+
+
+def test_bound_methods_are_weak(signal):
+    """Assert bound methods don't keep their object alive and are disconnected once collected."""
+    listener = _Listener()
+    signal.connect(listener.callback)
+    del listener
+    gc.collect()
+    assert not signal._funcs  # pylint: disable=protected-access
+    signal.emit(1)
+
+
+def test_weak_method_fallback():
+    """Assert the python-2 fallback resolve the method until it's object is collected."""
+    collected = []
+    listener = _Listener()
+    ref = _WeakMethod(listener.callback, collected.append)
+    ref()(1)
+    assert listener.calls == [1]
+    del listener
+    gc.collect()
+    assert ref() is None
+    assert collected == [ref]
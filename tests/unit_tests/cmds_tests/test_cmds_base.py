@@ -178,6 +178,17 @@ def test_addAttr_missingName(cmds):  # pylint: disable=invalid-name
     # )
 
 
+def test_addAttr_existing(cmds):  # pylint: disable=invalid-name
+    """Ensure a RuntimeError is raised when an attribute name is already in use."""
+    node = cmds.createNode("transform")
+    cmds.addAttr(node, longName="foo", shortName="f")
+    with pytest.raises(RuntimeError):
+        cmds.addAttr(node, longName="foo")
+    with pytest.raises(RuntimeError):
+        cmds.addAttr(node, longName="bar", shortName="f")
+    assert cmds.listAttr(node, userDefined=True) == ["foo"]
+
+
 def test_deleteAttr(cmds):  # pylint: disable=invalid-name
     """Ensure we can delete a dynamic attribute."""
     node = cmds.createNode("transform")
@@ -232,6 +243,17 @@ def test_listAttr(cmds):  # pylint: disable=invalid-name
     assert cmds.listAttr(node, userDefined=True) == ["foo"]
 
 
+def test_listAttr_flags(cmds):  # pylint: disable=invalid-name
+    """Ensure listAttr can filter attributes by their flags."""
+    node = cmds.createNode("transform")
+    cmds.addAttr(node, longName="foo")
+    cmds.addAttr(node, longName="bar", keyable=True)
+    cmds.addAttr(node, longName="baz", multi=True)
+    assert cmds.listAttr(node, userDefined=True, keyable=True) == ["bar"]
+    assert cmds.listAttr(node, ud=True, m=True) == ["baz"]
+    assert sorted(cmds.listAttr(node, ud=True, r=True, w=True)) == ["bar", "baz", "foo"]
+
+
 def test_nodeType(cmds):  # pylint: disable=invalid-name
     """Ensure nodeType work as expected."""
     node = cmds.createNode("transform")
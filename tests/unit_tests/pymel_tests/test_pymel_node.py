@@ -2,6 +2,8 @@
 Test cases for MockedPymelNode
 """
 # pylint: disable=redefined-outer-name
+import weakref
+
 import six
 
 import pytest
@@ -70,6 +72,11 @@ def test__getattr__missing(node):
     # assert str(exception.value) == ''  # TODO: Validate exception message
 
 
+def test_weakref(node):
+    """Validate a node can be weakly referenced."""
+    assert weakref.ref(node)() is node
+
+
 def test_attr(pymel, node):
     """Validate the `attr` method behavior"""
     port = node.attr("foo")
@@ -2,6 +2,8 @@
 Test cases for MockedPymelPort
 """
 # pylint: disable=redefined-outer-name
+import weakref
+
 import six
 
 import pytest
@@ -67,3 +69,8 @@ def test_repr__(port):
     actual = repr(port)
     assert actual == "Attribute(u'transform1.fooLong')"
     assert isinstance(actual, str)
+
+
+def test_weakref(port):
+    """Validate a port can be weakly referenced."""
+    assert weakref.ref(port)() is port